@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, AsyncIterator, Optional
 
 from academic_research_mentor.llm import LLMClient, create_client, Message, ToolCall
@@ -14,6 +16,7 @@ class MentorAgent:
     """Research mentor agent with tool calling support."""
 
     MAX_TOOL_ITERATIONS = 5  # Prevent infinite loops
+    MAX_PARALLEL_TOOLS = 8  # Independent tool calls from one response run concurrently
 
     def __init__(
         self,
@@ -27,10 +30,14 @@ class MentorAgent:
         self.tools = tools or ToolRegistry()
         self.max_history = max_history
         self._history: list[Message] = []
+        self._system_message = Message.system(system_prompt)
 
     def _get_messages(self, user_message: Any, context: Optional[str] = None) -> list[Message]:
         """Build message list with system prompt, history, and user message."""
-        messages = [Message.system(self.system_prompt)]
+        # Reuse the pre-built system message unless the prompt was reassigned
+        if self._system_message.content != self.system_prompt:
+            self._system_message = Message.system(self.system_prompt)
+        messages = [self._system_message]
 
         if self._history:
             history_slice = self._history[-self.max_history:]
@@ -47,16 +54,23 @@ class MentorAgent:
             messages.append(Message.user(full_message))
         return messages
 
-    def _execute_tool_calls(self, tool_calls: list[ToolCall]) -> list[Message]:
-        """Execute tool calls and return tool response messages."""
-        tool_messages = []
-        
-        for tc in tool_calls:
+    def _run_tool_calls(self, tool_calls: list[ToolCall]) -> list[ToolResult]:
+        """Execute tool calls, concurrently when there are several, in call order."""
+        def _run(tc: ToolCall) -> ToolResult:
             result = self.tools.execute(tc.name, **tc.arguments)
             result.tool_call_id = tc.id  # Set the tool call ID
-            tool_messages.append(result.to_message())
-        
-        return tool_messages
+            return result
+
+        if len(tool_calls) <= 1:
+            return [_run(tc) for tc in tool_calls]
+        # Tool calls are mostly network-bound searches; overlap their latency
+        workers = min(self.MAX_PARALLEL_TOOLS, len(tool_calls))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_run, tool_calls))
+
+    def _execute_tool_calls(self, tool_calls: list[ToolCall]) -> list[Message]:
+        """Execute tool calls and return tool response messages."""
+        return [result.to_message() for result in self._run_tool_calls(tool_calls)]
 
     def chat(self, user_message: Any, context: Optional[str] = None) -> str:
         """Send a message and get a response (with automatic tool calling)."""
@@ -119,67 +133,63 @@ class MentorAgent:
     ) -> AsyncIterator[StreamChunk]:
         """Stream a response asynchronously with tool support.
         
-        If tools are needed, executes them first (emitting status chunks),
-        then streams the final response.
+        Each round is streamed directly with the tool definitions attached.
+        Rounds that end in tool calls emit status chunks, run the tools and
+        loop; the first round without tool calls is the final answer.
         """
         messages = self._get_messages(user_message, context)
         tool_definitions = self.tools.get_definitions() if len(self.tools) > 0 else None
         
-        # Tool calling loop (non-streaming to detect tool calls)
-        for iteration in range(self.MAX_TOOL_ITERATIONS):
-            # Check if we need to call tools first
-            if tool_definitions and iteration == 0:
-                # Make a non-streaming call to check for tool calls
-                response, tool_calls = await self.client.chat_async(messages, tools=tool_definitions)
-                
-                if tool_calls:
-                    # Emit tool status chunks
-                    for tc in tool_calls:
-                        yield StreamChunk(
-                            tool_status="calling",
-                            tool_name=tc.name,
-                            content=f"Calling tool: {tc.name}"
-                        )
-                    
-                    # Execute tools
-                    messages.append(response)
-                    for tc in tool_calls:
-                        yield StreamChunk(
-                            tool_status="executing",
-                            tool_name=tc.name
-                        )
-                        result = self.tools.execute(tc.name, **tc.arguments)
-                        result.tool_call_id = tc.id
-                        messages.append(result.to_message())
-                        yield StreamChunk(
-                            tool_status="completed",
-                            tool_name=tc.name,
-                            tool_result=result.content[:500] + "..." if len(result.content) > 500 else result.content
-                        )
-                    
-                    # Continue loop to get final response (or more tool calls)
+        for _ in range(self.MAX_TOOL_ITERATIONS):
+            full_content = ""
+            tool_calls: list[ToolCall] = []
+            
+            async for chunk in self.client.stream_async(
+                messages,
+                tools=tool_definitions,
+                include_reasoning=include_reasoning
+            ):
+                if chunk.tool_calls:
+                    tool_calls.extend(chunk.tool_calls)
                     continue
+                if chunk.content:
+                    full_content += chunk.content
+                yield chunk
             
-            # Stream the final response (no more tool calls needed)
-            break
-        
-        # Now stream the final response
-        full_content = ""
-        full_reasoning = ""
-        
-        async for chunk in self.client.stream_async(
-            messages,
-            include_reasoning=include_reasoning
-        ):
-            if chunk.content:
-                full_content += chunk.content
-            if chunk.reasoning:
-                full_reasoning += chunk.reasoning
-            yield chunk
+            if not tool_calls:
+                # Update history after streaming completes
+                self._history.append(Message.user(user_message))
+                self._history.append(Message.assistant(full_content))
+                return
+            
+            # Emit tool status chunks
+            for tc in tool_calls:
+                yield StreamChunk(
+                    tool_status="calling",
+                    tool_name=tc.name,
+                    content=f"Calling tool: {tc.name}"
+                )
+            
+            # Execute tools
+            messages.append(Message.assistant(full_content, tool_calls))
+            for tc in tool_calls:
+                yield StreamChunk(
+                    tool_status="executing",
+                    tool_name=tc.name
+                )
+            results = await asyncio.to_thread(self._run_tool_calls, tool_calls)
+            for tc, result in zip(tool_calls, results):
+                messages.append(result.to_message())
+                yield StreamChunk(
+                    tool_status="completed",
+                    tool_name=tc.name,
+                    tool_result=result.content[:500] + "..." if len(result.content) > 500 else result.content
+                )
         
-        # Update history after streaming completes
-        self._history.append(Message.user(user_message))
-        self._history.append(Message.assistant(full_content))
+        # Max iterations reached
+        yield StreamChunk(
+            content="I apologize, but I encountered an issue processing your request. Please try again."
+        )
 
     def clear_history(self) -> None:
         """Clear conversation history."""
@@ -72,10 +72,12 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._definitions: Optional[list[ToolDefinition]] = None
     
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._definitions = None
     
     def register_function(
         self,
@@ -91,14 +93,17 @@ class ToolRegistry:
             _function=function,
             _parameters=parameters or {"type": "object", "properties": {}}
         )
+        self._definitions = None
     
     def get(self, name: str) -> Optional[Tool]:
         """Get a tool by name."""
         return self._tools.get(name)
     
     def get_definitions(self) -> list[ToolDefinition]:
-        """Get all tool definitions."""
-        return [tool.to_definition() for tool in self._tools.values()]
+        """Get all tool definitions (built once until the registry changes)."""
+        if self._definitions is None:
+            self._definitions = [tool.to_definition() for tool in self._tools.values()]
+        return list(self._definitions)
     
     def execute(self, name: str, **kwargs: Any) -> ToolResult:
         """Execute a tool and return the result."""
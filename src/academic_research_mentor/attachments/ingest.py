@@ -2,6 +2,7 @@ from __future__ import annotations
 
 """Minimal PDF attachments ingestion for session-scoped retrieval."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Tuple
 import os
 
@@ -14,6 +15,7 @@ _chunk_meta: list[dict] = []
 _retriever: Any | None = None
 _summary: dict[str, Any] = {"files": 0, "pages": 0, "chunks": 0}
 _doc_summary: str = ""
+_fingerprint: tuple | None = None
 _LIMITS = {"max_mb": 50, "max_pages": 500}
 _DEFAULT_K = 12
 
@@ -73,14 +75,42 @@ def _load_pdfs(paths: list[str]) -> tuple[list[Any], dict[str, int]]:
     return load_pdfs(paths, _LIMITS)
 
 
+def _attachment_fingerprint(paths: list[str]) -> tuple | None:
+    """Identify an attachment set by resolved path, size and mtime."""
+    entries = []
+    for p in paths:
+        abs_path = os.path.abspath(os.path.expanduser(p))
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            continue
+        entries.append((abs_path, st.st_size, st.st_mtime_ns))
+    return tuple(sorted(set(entries))) or None
+
+
 def attach_pdfs(paths: list[str]) -> dict[str, Any]:
     """Attach PDFs for current session and build a retriever.
 
-    Returns summary with counts. Safe to call multiple times; rebuilds index.
+    Returns summary with counts. Safe to call multiple times: the index is
+    rebuilt when the set of files changes, and reused as-is when the same
+    files (by path, size and mtime) are attached again.
     """
-    global _retriever, _chunk_texts, _chunk_meta, _summary, _doc_summary
+    global _retriever, _chunk_texts, _chunk_meta, _summary, _doc_summary, _fingerprint
+
+    # The same file passed twice (e.g. repeated --attach-pdf) is parsed once
+    unique: dict[str, str] = {}
+    for p in paths:
+        unique.setdefault(os.path.abspath(os.path.expanduser(p)), p)
+    paths = list(unique.values())
+
+    # Unchanged files: keep the existing index and summary instead of
+    # re-embedding and re-summarizing the same content.
+    fingerprint = _attachment_fingerprint(paths)
+    if fingerprint is not None and fingerprint == _fingerprint and _chunk_texts:
+        return dict(_summary)
 
     docs, stats = _load_pdfs(paths)
+    _fingerprint = None
     if not docs:
         _retriever = None
         _chunk_texts = []
@@ -98,11 +128,15 @@ def attach_pdfs(paths: list[str]) -> dict[str, Any]:
     _chunk_texts = [c.page_content for c in chunks]
     _chunk_meta = [c.metadata or {} for c in chunks]
 
-    backend_name, retr = _try_build_vector_retriever(chunks)
-    _retriever = retr
+    # Embedding the chunks and summarizing the documents are independent remote
+    # calls; overlap them instead of paying both latencies back to back.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        summary_future = pool.submit(generate_document_summary, docs)
+        backend_name, retr = _try_build_vector_retriever(chunks)
+        _retriever = retr
 
-    # Generate document summary for context awareness
-    _doc_summary = generate_document_summary(docs)
+        # Document summary for context awareness
+        _doc_summary = summary_future.result()
 
     _summary = {
         "files": len({(d.metadata or {}).get("source") for d in docs}),
@@ -112,6 +146,7 @@ def attach_pdfs(paths: list[str]) -> dict[str, Any]:
         "skipped_large": int(stats.get("skipped_large", 0)),
         "truncated": int(stats.get("truncated", 0)),
     }
+    _fingerprint = fingerprint
     return _summary
 
 
@@ -2,19 +2,26 @@
 
 import json
 import os
+import sys
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import IO, List, Dict, Any, Optional
 from pathlib import Path
 
 from .session_logging import SessionLogManager
 
 
+def _intern_short(value: Any) -> Any:
+    """Intern short strings (commands, stage codes) that repeat across turns."""
+    if isinstance(value, str) and len(value) < 64:
+        return sys.intern(value)
+    return value
+
+
 class ChatLogger:
     """Logs chat conversations in JSON format similar to the provided examples."""
     
     def __init__(self, log_dir: str = "convo-logs", session_logger: Optional[SessionLogManager] = None):
         self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(parents=True, exist_ok=True)
         self._session_logger = session_logger
         if session_logger:
             self.session_id = session_logger.session_id
@@ -24,23 +31,62 @@ class ChatLogger:
             self.session_start_time = now
             self.session_id = f"chat_{now.strftime('%Y%m%d_%H%M%S')}"
         self.session_dir = self.log_dir / self.session_id
-        if not self.session_dir.exists():
+        self._log_file = self.session_dir / f"{self.session_id}.json"
+        # The session logger already created its directory; otherwise one
+        # mkdir with parents=True covers both log_dir and session_dir.
+        if not (session_logger and session_logger.session_dir == self.session_dir):
             self.session_dir.mkdir(parents=True, exist_ok=True)
         self.current_session = []
         self._exit_handler_registered = False
         self._pending_stage: Optional[Dict[str, Any]] = None
         self._real_turns: int = 0
+        self._has_ai_responses = False
+        # Chat log is streamed as a JSON array: opened on the first entry,
+        # one element appended per turn, closed with "]" by save_session().
+        self._fh: Optional[IO[str]] = None
+        # Compact JSON by default; ARM_LOG_PRETTY=1 restores indented output
+        self._pretty = os.environ.get("ARM_LOG_PRETTY", "").lower() in ("1", "true", "yes")
 
     def _log_path(self) -> Path:
         """Return the path for the primary chat log file."""
-        return self.session_dir / f"{self.session_id}.json"
+        return self._log_file
         
-    def set_pending_stage(self, stage: Dict[str, Any]) -> None:
-        """Set a stage dict to be attached to the next added turn."""
+    def _append_entry(self, turn_data: Dict[str, Any]) -> None:
+        """Record a turn and append it to the on-disk log incrementally."""
+        self.current_session.append(turn_data)
         try:
-            self._pending_stage = dict(stage) if isinstance(stage, dict) else None
+            if self._fh is None:
+                # (Re)open writes every entry so far, so a log reopened after
+                # save_session() still holds the full session.
+                self._fh = open(self._log_path(), "w", encoding="utf-8", buffering=1 << 16)
+                self._fh.write("[\n" + ",\n".join(self._dump(t) for t in self.current_session))
+            else:
+                self._fh.write(",\n" + self._dump(turn_data))
+            # Flush per turn so a crash leaves a recoverable partial log
+            self._fh.flush()
         except Exception:
-            self._pending_stage = None
+            self._close_log()
+
+    def _dump(self, turn_data: Dict[str, Any]) -> str:
+        if self._pretty:
+            return json.dumps(turn_data, ensure_ascii=False, indent=2)
+        return json.dumps(turn_data, ensure_ascii=False, separators=(",", ":"))
+
+    def _close_log(self) -> None:
+        fh, self._fh = self._fh, None
+        if fh is not None:
+            try:
+                fh.close()
+            except Exception:
+                pass
+
+    def set_pending_stage(self, stage: Dict[str, Any]) -> None:
+        """Set a stage dict to be attached to the next added turn.
+
+        The dict is held by reference (callers must not mutate it afterwards);
+        add_turn() builds its own copy when the stage is consumed.
+        """
+        self._pending_stage = stage if isinstance(stage, dict) else None
 
     def add_turn(self, 
                  user_prompt: str, 
@@ -51,17 +97,21 @@ class ChatLogger:
         turn_number = len(self.current_session) + 1
         turn_data: Dict[str, Any] = {
             "turn": turn_number,
-            "user_prompt": user_prompt,
+            "user_prompt": _intern_short(user_prompt),
             "tool_calls": tool_calls,
             "ai_response": ai_response
         }
         stage_payload = stage if stage is not None else self._pending_stage
         if stage_payload:
+            # Stage keys/names recur every turn; share one string object each
+            stage_payload = {sys.intern(str(k)): _intern_short(v) for k, v in stage_payload.items()}
             turn_data["stage"] = stage_payload
         # Clear pending stage after consumption
         self._pending_stage = None
-        self.current_session.append(turn_data)
+        self._append_entry(turn_data)
         self._real_turns += 1
+        if ai_response:
+            self._has_ai_responses = True
         if self._session_logger:
             self._session_logger.finalize_turn(turn_number, {
                 "user_prompt": user_prompt,
@@ -79,7 +129,7 @@ class ChatLogger:
             "tool_calls": [],
             "ai_response": None
         }
-        self.current_session.append(turn_data)
+        self._append_entry(turn_data)
         if self._session_logger:
             self._session_logger.log_event("exit_recorded", {"exit_command": exit_command, "turn": turn_number})
             self._session_logger.finalize_turn(turn_number, {
@@ -95,15 +145,21 @@ class ChatLogger:
             return ""
             
         log_file = self._log_path()
-        
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(self.current_session, f, indent=2, ensure_ascii=False)
+
+        if self._fh is None:
+            # Entries were recorded but the stream is unavailable; write it whole
+            with open(log_file, "w", encoding="utf-8") as fh:
+                fh.write("[\n" + ",\n".join(self._dump(t) for t in self.current_session) + "\n]\n")
+        else:
+            self._fh.write("\n]\n")
+            self._close_log()
 
         if self._session_logger:
-            summary = self.get_session_summary()
-            self._session_logger.attach_metadata("chat_log_path", str(log_file))
-            self._session_logger.attach_metadata("total_turns", summary["total_turns"])
-            self._session_logger.attach_metadata("chat_log_dir", str(self.session_dir))
+            self._session_logger.update_metadata({
+                "chat_log_path": str(log_file),
+                "total_turns": self._real_turns,
+                "chat_log_dir": str(self.session_dir),
+            })
             
         return str(log_file)
 
@@ -121,5 +177,5 @@ class ChatLogger:
             "session_start": self.session_start_time.isoformat(),
             "log_file": self._log_path().name,
             "log_dir": str(self.session_dir),
-            "has_ai_responses": any(turn.get("ai_response") for turn in self.current_session)
+            "has_ai_responses": self._has_ai_responses
         }
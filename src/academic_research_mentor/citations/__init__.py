@@ -7,7 +7,7 @@ Provides lightweight models and formatting helpers to standardize
 citations across tools without introducing heavy dependencies.
 """
 
-from .models import Citation
+from .models import Citation, stable_id
 from .formatter import CitationFormatter
 from .validator import CitationValidator
 from .aggregator import CitationAggregator
@@ -19,6 +19,7 @@ __all__ = [
     "CitationValidator",
     "CitationAggregator",
     "CitationMerger",
+    "stable_id",
 ]
 
 
@@ -10,16 +10,34 @@ Goals:
 
 from __future__ import annotations
 
+import os
 import re
-from typing import Iterable, List, Dict, Any, Tuple
+from functools import lru_cache
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 
+_CITATION_REGEX = r"\[(?P<prefix>[APGW])(?P<idx>\d+)(?P<suffix>[^\]]*)\]"
 
-CITATION_PATTERN = re.compile(r"\[(?P<prefix>[APGW])(?P<idx>\d+)(?P<suffix>[^\]]*)\]")
+
+def _compile_citation_pattern() -> Any:
+    """Compile with google-re2 (linear-time DFA) when ARM_CITATION_RE2 is set and installed."""
+    if os.environ.get("ARM_CITATION_RE2", "").lower() in ("1", "true", "yes"):
+        try:
+            import re2  # type: ignore
+
+            return re2.compile(_CITATION_REGEX)
+        except Exception:
+            pass
+    return re.compile(_CITATION_REGEX)
+
+
+# Both engines expose finditer/search(pos, endpos)/sub with named groups
+CITATION_PATTERN = _compile_citation_pattern()
 
 DEFAULT_LEGEND = (
     "Sources — A: attachments; P: papers/arxiv/unified; G: research guidelines; "
     "W: web/news. Strength flags: †strong (peer-reviewed/curated), †weak (blog/forum)."
 )
+_LEGEND_TAIL = "\n\n" + DEFAULT_LEGEND
 
 
 def _normalize_id(prefix: str, idx: str, suffix: str) -> str:
@@ -28,6 +46,26 @@ def _normalize_id(prefix: str, idx: str, suffix: str) -> str:
     return f"[{prefix}{int(idx)}{suffix_clean}]"
 
 
+_META_FIELDS = ("title", "venue", "domain", "year", "strength")
+
+
+def _freeze_meta(value: Any) -> Optional[str]:
+    """Hashable cache-key form of a metadata field, formatted as _build_meta would (str; falsy -> None)."""
+    return str(value) if value else None
+
+
+def _build_meta(item: Dict[str, Any]) -> str:
+    title = str(item.get("title") or "").strip()
+    venue = str(item.get("venue") or item.get("domain") or "").strip()
+    year = str(item.get("year") or "").strip()
+    parts = [p for p in (title, venue, year) if p]
+    suffix = " | ".join(parts) if parts else ""
+    strength = item.get("strength")
+    if strength in {"strong", "weak"}:
+        suffix = f"{suffix} [{strength}]" if suffix else f"[{strength}]"
+    return suffix
+
+
 def enforce_citation_schema(
     text: str,
     *,
@@ -45,56 +83,56 @@ def enforce_citation_schema(
     Returns:
         Possibly modified text with normalized citations and legend.
     """
-    if not text:
+    # Every citation token starts with "[", so a fast substring check skips the regex
+    if not text or "[" not in text:
         return text
 
-    matches = list(CITATION_PATTERN.finditer(text))
-    if not matches:
-        return text
-
-    normalized_ids: List[str] = []
-    output = text
-    for m in matches:
-        old = m.group(0)
-        new = _normalize_id(m.group("prefix"), m.group("idx"), m.group("suffix"))
-        if old != new:
-            output = output.replace(old, new)
-        normalized_ids.append(new)
-
-    # Inject first-mention micro-metadata when available
-    if source_metadata:
-        meta_map = {str(item.get("id")): item for item in source_metadata}
-        seen: set[str] = set()
-
-        def _build_meta(item: Dict[str, Any]) -> str:
-            title = str(item.get("title") or "").strip()
-            venue = str(item.get("venue") or item.get("domain") or "").strip()
-            year = str(item.get("year") or "").strip()
-            parts = [p for p in (title, venue, year) if p]
-            suffix = " | ".join(parts) if parts else ""
-            strength = item.get("strength")
-            if strength in {"strong", "weak"}:
-                suffix = f"{suffix} [{strength}]" if suffix else f"[{strength}]"
-            return suffix
-
-        def _attach_meta(match: re.Match) -> str:
-            cid = f"{match.group('prefix')}{int(match.group('idx'))}"
-            token = match.group(0)
-            if cid in seen or cid not in meta_map:
-                return token
+    meta_key: Tuple[Tuple[Any, ...], ...] = (
+        tuple(
+            (str(item.get("id")),) + tuple(_freeze_meta(item.get(field)) for field in _META_FIELDS)
+            for item in source_metadata
+        )
+        if source_metadata
+        else ()
+    )
+    return _enforce_cached(text, meta_key, add_legend)
+
+
+@lru_cache(maxsize=512)
+def _enforce_cached(text: str, meta_key: Tuple[Tuple[Any, ...], ...], add_legend: bool) -> str:
+    """Pure worker behind ``enforce_citation_schema``; memoized for retries/re-renders."""
+    meta_map: Dict[str, Dict[str, Any]] = {
+        row[0]: dict(zip(_META_FIELDS, row[1:])) for row in meta_key
+    }
+    seen: set[str] = set()
+
+    # Single walk: normalize tokens and inject first-mention metadata
+    parts: List[str] = []
+    last = 0
+    for m in CITATION_PATTERN.finditer(text):
+        parts.append(text[last:m.start()])
+        # Inlined _normalize_id: one int() and no extra call frame per citation
+        prefix, idx, suffix = m.group("prefix", "idx", "suffix")
+        cid = f"{prefix}{int(idx)}"
+        token = f"[{cid}{suffix or ''}]"
+        if cid in meta_map and cid not in seen:
             seen.add(cid)
             meta = _build_meta(meta_map[cid])
-            if not meta:
-                return token
-            return f"{token} ({meta})"
+            if meta:
+                token = f"{token} ({meta})"
+        parts.append(token)
+        last = m.end()
 
-        output = CITATION_PATTERN.sub(_attach_meta, output)
+    if not parts:
+        return text
+    parts.append(text[last:])
 
     # Append legend if not present
-    if add_legend and "Sources —" not in output:
-        output = output.rstrip() + "\n\n" + DEFAULT_LEGEND
+    if add_legend and "Sources —" not in text:
+        parts[-1] = parts[-1].rstrip()
+        parts.append(_LEGEND_TAIL)
 
-    return output
+    return "".join(parts)
 
 
 def summarize_sources_for_footer(sources: List[Dict[str, Any]]) -> str:
@@ -107,15 +145,19 @@ def summarize_sources_for_footer(sources: List[Dict[str, Any]]) -> str:
         cid = str(src.get("id") or "")
         if not cid:
             continue
-        bucket = cid[0]
-        buckets.setdefault(bucket, [])
+        names = buckets.get(cid[0])
+        if names is None:
+            names = buckets[cid[0]] = []
+        elif len(names) >= 3:
+            # Only the first three titles per bucket are shown
+            continue
         title = str(src.get("title") or src.get("domain") or src.get("venue") or "").strip()
         if title:
-            buckets[bucket].append(title[:80])
+            names.append(title)
 
     parts = []
     for prefix, names in buckets.items():
         if names:
-            parts.append(f"{prefix}: {', '.join(names[:3])}")
+            parts.append(f"{prefix}: {', '.join(name[:80] for name in names)}")
 
     return "Sources by bucket — " + "; ".join(parts)
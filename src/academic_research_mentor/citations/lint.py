@@ -13,25 +13,28 @@ from typing import Dict, List
 
 from .enforcer import CITATION_PATTERN
 
+NUMERIC_PATTERN = re.compile(r"\b\d[\d,]*(?:\.\d+)?%?")
+LEGEND_MARKER = "Sources —"
+
 
 def lint_response(text: str) -> Dict[str, List[str]]:
     """Return lint findings for a response string."""
     issues: List[str] = []
     if not text:
         return {"issues": ["empty_response"]}
+    if "[" not in text:
+        return {"issues": issues}
 
-    citations = list(CITATION_PATTERN.finditer(text))
-    has_cites = bool(citations)
+    has_cites = CITATION_PATTERN.search(text) is not None
 
-    if has_cites and "Sources —" not in text:
+    if has_cites and LEGEND_MARKER not in text:
         issues.append("legend_missing")
 
     if has_cites:
         # Heuristic: numbers (percentages/years) should be cited
-        numeric_tokens = list(re.finditer(r"\b\d[\d,]*(?:\.\d+)?%?", text))
-        for m in numeric_tokens:
-            tail = text[m.end() : m.end() + 18]
-            if not CITATION_PATTERN.search(tail):
+        for m in NUMERIC_PATTERN.finditer(text):
+            end = m.end()
+            if not CITATION_PATTERN.search(text, end, end + 18):
                 issues.append("number_without_citation")
                 break
 
@@ -9,7 +9,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple
 from collections import defaultdict
 
-from .models import Citation
+from .models import Citation, stable_id as make_stable_id
 from .aggregator import CitationAggregator
 from .enforcer import enforce_citation_schema, summarize_sources_for_footer
 
@@ -47,7 +47,7 @@ class CitationMerger:
                 
             url = str(paper.get("url", "")).strip()
             title = str(paper.get("title", "")).strip() or "Untitled"
-            cid = f"paper_{abs(hash(url or title)) & 0xfffffff:x}"
+            cid = make_stable_id("paper", url or title)
             
             citation = Citation(
                 id=cid,
@@ -73,7 +73,7 @@ class CitationMerger:
                 
             url = str(guideline.get("url", "")).strip()
             title = str(guideline.get("title", "")).strip() or "Research Guidance"
-            cid = f"guideline_{abs(hash(url or title)) & 0xfffffff:x}"
+            cid = make_stable_id("guideline", url or title)
             
             citation = Citation(
                 id=cid,
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
+def stable_id(prefix: str, *parts: str, digest_size: int = 4) -> str:
+    """Deterministic short ID (``prefix_<hex>``) that is stable across processes.
+
+    Unlike the builtin ``hash()``, which is randomized per interpreter run,
+    the same parts always yield the same ID.
+    """
+    payload = "\x1f".join(str(p) for p in parts).encode("utf-8", "ignore")
+    return f"{prefix}_{hashlib.blake2b(payload, digest_size=digest_size).hexdigest()}"
+
+
 @dataclass
 class Citation:
     """Lightweight citation record used across tools.
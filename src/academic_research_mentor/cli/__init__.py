@@ -1,4 +1,11 @@
 # CLI package for Academic Research Mentor
 # Now uses simplified CLI with direct OpenAI SDK
 
-from ..cli_simple import main as main
+
+
+def main() -> None:
+    # Imported on call so that loading cli.* submodules (e.g. cli.commands)
+    # does not pull in the agent/LLM stack behind cli_simple.
+    from ..cli_simple import main as _main
+
+    _main()
@@ -1,20 +1,27 @@
 from __future__ import annotations
 
 import os
-from ..rich_formatter import print_info, print_error, get_formatter
+from ..rich_formatter import print_info, print_info_many, print_error, get_formatter
+
+
+# (env var, status label, help text) — shared by verify_environment and show_env_help
+_API_KEYS: tuple[tuple[str, str, str], ...] = (
+    ("OPENROUTER_API_KEY", "OpenRouter (required)", "Required for OpenRouter-based mentoring"),
+)
+# (env var, default)
+_MODEL_CONFIGS: tuple[tuple[str, str], ...] = (
+    ("OPENROUTER_MODEL", "anthropic/claude-sonnet-4"),
+)
 
 
 def verify_environment() -> None:
     formatter = get_formatter()
     formatter.print_rule("Environment Configuration Status")
-
-    api_keys = [
-        ("OPENROUTER_API_KEY", "OpenRouter (required)"),
-    ]
+    env = os.environ
 
     configured_keys = []
-    for key, description in api_keys:
-        value = os.environ.get(key)
+    for key, description, _help in _API_KEYS:
+        value = env.get(key)
         if value:
             masked = f"{value[:6]}...{value[-4:]}" if len(value) > 10 else "***"
             print_info(f"✓ {key}: {masked} ({description})")
@@ -28,24 +35,23 @@ def verify_environment() -> None:
 
     formatter.console.print("")
 
-    model_configs = [
-        ("OPENROUTER_MODEL", "anthropic/claude-sonnet-4"),
-    ]
-
-    print_info("Model Configuration:")
-    for key, default in model_configs:
-        value = os.environ.get(key, default)
-        status = "custom" if os.environ.get(key) else "default"
-        print_info(f"  {key}: {value} ({status})")
+    model_lines = ["Model Configuration:"]
+    for key, default in _MODEL_CONFIGS:
+        value = env.get(key, default)
+        status = "custom" if env.get(key) else "default"
+        model_lines.append(f"  {key}: {value} ({status})")
+    print_info_many(model_lines)
 
     formatter.console.print("")
 
-    prompt_variant = os.environ.get("ARM_PROMPT", os.environ.get("LC_PROMPT", "mentor"))
-    ascii_mode = bool(os.environ.get("ARM_PROMPT_ASCII", os.environ.get("LC_PROMPT_ASCII")))
+    prompt_variant = next((env[k] for k in ("ARM_PROMPT", "LC_PROMPT") if k in env), "mentor")
+    ascii_mode = bool(next((env[k] for k in ("ARM_PROMPT_ASCII", "LC_PROMPT_ASCII") if k in env), None))
 
-    print_info("Agent Configuration:")
-    print_info(f"  Prompt Variant: {prompt_variant}")
-    print_info(f"  ASCII Mode: {ascii_mode}")
+    print_info_many([
+        "Agent Configuration:",
+        f"  Prompt Variant: {prompt_variant}",
+        f"  ASCII Mode: {ascii_mode}",
+    ])
 
     formatter.console.print("")
 
@@ -54,8 +60,11 @@ def show_env_help() -> None:
     formatter = get_formatter()
     formatter.print_rule("Environment Variables Help")
 
+    api_key_help = "\n".join(f"• [bold]{key}[/bold] - {text}" for key, _label, text in _API_KEYS)
+    model_help = "\n".join(f"• [bold]{key}[/bold] (default: {default})" for key, default in _MODEL_CONFIGS)
+
     formatter.console.print(
-        """
+        f"""
 [bold cyan]Using .env File:[/bold cyan]
 
 The Academic Research Mentor automatically loads environment variables from a .env file.
@@ -63,11 +72,11 @@ Place your .env file in the project root directory or any parent directory.
 
 [bold cyan]Required API Keys:[/bold cyan]
 
-• [bold]OPENROUTER_API_KEY[/bold] - Required for OpenRouter-based mentoring
+{api_key_help}
 
 [bold cyan]Optional Model Configuration:[/bold cyan]
 
-• [bold]OPENROUTER_MODEL[/bold] (default: anthropic/claude-sonnet-4)
+{model_help}
 
 [bold cyan]Agent Configuration:[/bold cyan]
 
@@ -148,11 +157,13 @@ def show_runs_command() -> None:
     try:
         from ..core.transparency import get_transparency_store
         store = get_transparency_store()
-        runs = store.list_runs()[:10]
+        runs = store.list_runs(limit=10)
         if not runs:
             print_info("No tool runs recorded in this session.")
         else:
-            for r in runs:
-                print_info(f"run={r.run_id} tool={r.tool_name} status={r.status} events={len(r.events)}")
+            # One render/flush (and one UI event) for the whole listing
+            print_info("\n".join(
+                f"run={r.run_id} tool={r.tool_name} status={r.status} events={len(r.events)}" for r in runs
+            ))
     except Exception as e:  # noqa: BLE001
         print_error(f"Show runs failed: {e}")
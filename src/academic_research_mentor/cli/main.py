@@ -2,24 +2,54 @@ from __future__ import annotations
 
 import os
 import signal
+import sys
+from typing import Any, Callable, Optional
+
 from ..core.bootstrap import bootstrap_registry_if_enabled
-from ..rich_formatter import print_error
-from ..runtime.context import prepare_agent
+from ..rich_formatter import print_error, print_info
 
 from .args import build_parser
-from .commands import (
-    verify_environment,
-    show_env_help,
-    list_tools_command,
-    show_candidates_command,
-    recommend_command,
-    show_runs_command,
-)
-from .repl import online_repl
-from .openrouter_setup import maybe_run_openrouter_setup
 from .session import load_env_file, signal_handler
 
 
+_MODEL_INIT_FAILED = (
+    "Model initialization failed. Set OPENROUTER_API_KEY in your .env and re-run: "
+    "uv run academic-research-mentor --check-env"
+)
+
+# Flag-only subcommands (in dispatch order) that need no parsed namespace
+_FAST_FLAGS: tuple[tuple[str, str], ...] = (
+    ("--check-env", "verify_environment"),
+    ("--env-help", "show_env_help"),
+    ("--list-tools", "list_tools_command"),
+    ("--show-runs", "show_runs_command"),
+)
+
+
+_FAST_FLAG_NAMES = frozenset(flag for flag, _handler in _FAST_FLAGS)
+
+
+def _sniff_fast_path(argv: list[str]) -> Optional[str]:
+    """Return the handler name for a flag-only subcommand, skipping argparse.
+
+    Only taken when argv consists solely of these flags; anything else
+    (--show-candidates, --recommend, --help, ...) goes through the full
+    dispatch so its precedence is unchanged.
+    """
+    if not argv or not set(argv) <= _FAST_FLAG_NAMES:
+        return None
+    return next((handler for flag, handler in _FAST_FLAGS if flag in argv), None)
+
+
+def _late_imports() -> tuple[Callable[..., Any], Callable[..., Any], Callable[..., Any]]:
+    """Import the agent/REPL stack only once a subcommand has not handled the run."""
+    from ..runtime.context import prepare_agent
+    from .openrouter_setup import maybe_run_openrouter_setup
+    from .repl import online_repl
+
+    return prepare_agent, maybe_run_openrouter_setup, online_repl
+
+
 def main() -> None:
     # Signals
     signal.signal(signal.SIGINT, signal_handler)
@@ -31,9 +61,15 @@ def main() -> None:
     # Feature-flagged registry
     discovered = bootstrap_registry_if_enabled()
     if discovered:
-        from ..rich_formatter import print_info
         print_info(f"Tool registry initialized: {', '.join(discovered)}")
 
+    fast = _sniff_fast_path(sys.argv[1:])
+    if fast:
+        from . import commands
+
+        getattr(commands, fast)()
+        return
+
     # Args
     parser = build_parser()
     try:
@@ -52,24 +88,31 @@ def main() -> None:
 
     # Commands
     if getattr(args, 'check_env', False):
+        from .commands import verify_environment
         verify_environment()
         return
     if getattr(args, 'env_help', False):
+        from .commands import show_env_help
         show_env_help()
         return
     if getattr(args, 'list_tools', False):
+        from .commands import list_tools_command
         list_tools_command()
         return
     if getattr(args, 'show_candidates', None):
+        from .commands import show_candidates_command
         show_candidates_command(str(getattr(args, 'show_candidates')))
         return
     if getattr(args, 'recommend', None):
+        from .commands import recommend_command
         recommend_command(str(getattr(args, 'recommend')))
         return
     if getattr(args, 'show_runs', False):
+        from .commands import show_runs_command
         show_runs_command()
         return
 
+    prepare_agent, maybe_run_openrouter_setup, online_repl = _late_imports()
     maybe_run_openrouter_setup(force=getattr(args, "interactive_setup", False))
 
     # Attach PDFs if provided (do this BEFORE building the agent so tools can reflect attachment presence)
@@ -78,7 +121,6 @@ def main() -> None:
         if pdfs:
             from ..attachments import attach_pdfs, get_summary
             attach_pdfs([str(p) for p in pdfs if p])
-            from ..rich_formatter import print_info
             summ = get_summary()
             msg = (
                 f"Attachments loaded: files={summ.get('files')}, pages={summ.get('pages')}, chunks={summ.get('chunks')} "
@@ -96,7 +138,7 @@ def main() -> None:
     prep = prepare_agent(prompt_arg=getattr(args, "prompt", None), ascii_override=ascii_override)
 
     if prep.agent is None:
-        print_error(prep.offline_reason or "Model initialization failed. Set OPENROUTER_API_KEY in your .env and re-run: uv run academic-research-mentor --check-env")
+        print_error(prep.offline_reason or _MODEL_INIT_FAILED)
         return
 
     # REPL
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import os
+import sys
 from typing import Any
 
+from rich.text import Text
+
 from ..rich_formatter import print_formatted_response, print_info, print_error, get_formatter, print_user_input
 from ..rich_ui.io_helpers import print_stage_badge
 from .session import cleanup_and_save_session
@@ -19,6 +23,9 @@ from .repl_helpers import (
 
 ## get_langchain_tools is defined in runtime/tools_wrappers.py; no duplication here.
 
+# Built once so Rich does not re-parse the prompt markup on every turn
+_YOU_PROMPT = Text.assemble(("You:", "bold cyan"), " ")
+
 
 def online_repl(agent: Any, loaded_variant: str) -> None:
     session_logger, chat_logger = create_session_stack(
@@ -39,20 +46,24 @@ def online_repl(agent: Any, loaded_variant: str) -> None:
     print_info("Type 'exit' to quit")
     formatter.console.print("")
 
+    # Set on the EOF/exit paths, which already saved the session
+    clean_exit = False
     try:
         while True:
             try:
-                formatter.console.print("[bold cyan]You:[/bold cyan] ", end="")
+                formatter.console.print(_YOU_PROMPT, end="")
                 user = input().strip()
                 session_logger.log_event("raw_input", {"text": user})
             except EOFError:
                 print_info("\n📝 EOF received. Saving chat session...")
                 cleanup_and_save_session(chat_logger, "EOF (Ctrl+D)", session_logger)
+                clean_exit = True
                 break
 
             outcome = handle_system_command(user, agent, session_logger, allow_resume=True)
             if outcome.exit_command:
                 cleanup_and_save_session(chat_logger, outcome.exit_command, session_logger)
+                clean_exit = True
                 break
             if outcome.handled:
                 formatter.console.print("")
@@ -61,9 +72,8 @@ def online_repl(agent: Any, loaded_variant: str) -> None:
             # Check for dynamic attachments via @filename
             if "@" in user:
                 try:
-                    import os
                     from ..attachments.ingest import add_pdfs
-                    
+
                     new_pdfs = []
                     for token in user.split():
                         if token.startswith("@"):
@@ -105,19 +115,15 @@ def online_repl(agent: Any, loaded_variant: str) -> None:
             formatter.console.print("")
     finally:
         try:
-            from .args import build_parser as _bp
-            p = _bp()
-            # crude parse to check flag presence in argv
-            import sys as _sys
-            if "--telemetry" in (_sys.argv or []):
+            # crude check for flag presence in argv
+            if "--telemetry" in (sys.argv or []):
                 u = _telemetry_usage()
                 m = _telemetry_metrics()
                 if u or m:
                     print_info(f"Telemetry: tools={u}, metrics={m}")
         except Exception:
             pass
-        exit_markers = {"exit", "quit", "/exit", "/quit", "eof (ctrl+d)"}
-        if not any((turn.get("user_prompt") or "").lower() in exit_markers for turn in chat_logger.current_session):
+        if not clean_exit:
             cleanup_and_save_session(chat_logger, "unexpected_exit", session_logger)
 
 
@@ -135,19 +141,23 @@ def offline_repl(reason: str) -> None:
         metadata["offline_reason"] = reason
     session_logger, chat_logger = create_session_stack(metadata)
 
+    # Set on the EOF/exit paths, which already saved the session
+    clean_exit = False
     try:
         while True:
             try:
-                formatter.console.print("[bold cyan]You:[/bold cyan] ", end="")
+                formatter.console.print(_YOU_PROMPT, end="")
                 user = input().strip()
                 session_logger.log_event("raw_input", {"text": user})
             except EOFError:
                 print_info("\n📝 EOF received. Saving chat session...")
                 cleanup_and_save_session(chat_logger, "EOF (Ctrl+D)", session_logger)
+                clean_exit = True
                 break
             outcome = handle_system_command(user, agent=None, session_logger=session_logger, allow_resume=False)
             if outcome.exit_command:
                 cleanup_and_save_session(chat_logger, outcome.exit_command, session_logger)
+                clean_exit = True
                 break
             if outcome.handled:
                 formatter.console.print("")
@@ -183,6 +193,5 @@ def offline_repl(reason: str) -> None:
 
             formatter.console.print("")
     finally:
-        exit_markers = {"exit", "quit", "/exit", "/quit", "eof (ctrl+d)"}
-        if not any((turn.get("user_prompt") or "").lower() in exit_markers for turn in chat_logger.current_session):
+        if not clean_exit:
             cleanup_and_save_session(chat_logger, "unexpected_exit", session_logger)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Tuple
 
 from ..session_logging import SessionLogManager, set_active_session_logger
@@ -12,6 +15,32 @@ from ..rich_formatter import print_info, print_error, print_formatted_response
 from .resume import handle_resume_command
 
 
+def _trigger_pattern(*phrases: str) -> re.Pattern[str]:
+    # Plain substring alternation (no word boundaries), matching the old `k in lower_q` checks
+    return re.compile("|".join(map(re.escape, phrases)), re.IGNORECASE)
+
+
+_MENTORSHIP_RE = _trigger_pattern(
+    "novel", "methodology", "publish", "publication",
+    "problem selection", "career", "taste", "mentor", "guideline",
+)
+_LITERATURE_RE = _trigger_pattern(
+    "related work", "literature", "papers", "sota", "baseline",
+    "survey", "prior work",
+)
+_EXPERIMENT_RE = _trigger_pattern(
+    "experiment", "hypothesis", "ablation",
+    "evaluation plan", "setup", "metrics",
+)
+
+
+_GROUNDING_INSTRUCTION = (
+    "Instruction: Ground your answer FIRST on the attached PDF context above when making claims; "
+    "include [file:page] citations. THEN, if it strengthens mentorship advice, incorporate insights from the "
+    "guidelines and literature context (summarize briefly and avoid over-citation)."
+)
+
+
 @dataclass
 class CommandOutcome:
     handled: bool
@@ -28,8 +57,9 @@ class ManualRoutingResult:
 def create_session_stack(metadata: Optional[Dict[str, Any]] = None) -> Tuple[SessionLogManager, ChatLogger]:
     logger = SessionLogManager()
     set_active_session_logger(logger)
-    for key, value in (metadata or {}).items():
-        logger.attach_metadata(key, value)
+    if metadata:
+        # One rewrite of the session file for all startup keys
+        logger.update_metadata(dict(metadata))
     chat_logger = ChatLogger(session_logger=logger)
     return logger, chat_logger
 
@@ -105,29 +135,28 @@ def process_manual_turn(user: str, session_logger: SessionLogManager, *, enable_
     return ManualRoutingResult(consumed=False, enhanced_input=user)
 
 
+@lru_cache(maxsize=1)
+def _enrichment_deps() -> SimpleNamespace:
+    """Resolve the attachment/tool callables once instead of importing them every turn."""
+    from ..attachments import has_attachments, search
+    from ..runtime.tool_impls import guidelines_tool_fn, experiment_planner_tool_fn  # type: ignore
+
+    return SimpleNamespace(
+        has_attachments=has_attachments,
+        search=search,
+        guidelines_tool=guidelines_tool_fn,
+        experiment_planner=experiment_planner_tool_fn,
+    )
+
+
 def build_react_enhanced_input(user: str, session_logger: SessionLogManager) -> str:
     try:
-        from ..attachments import has_attachments as _has_att, search as _att_search
-        from ..runtime.tool_impls import (
-            guidelines_tool_fn as _guidelines_tool,  # type: ignore
-            experiment_planner_tool_fn as _exp_plan,  # type: ignore
-        )
-        lower_q = user.lower()
-        mentorship_triggers = [
-            "novel", "novelty", "methodology", "publish", "publication",
-            "problem selection", "career", "taste", "mentor", "guideline",
-        ]
-        literature_triggers = [
-            "related work", "literature", "papers", "sota", "baseline",
-            "survey", "prior work",
-        ]
-        experiment_triggers = [
-            "experiment", "experiments", "hypothesis", "ablation",
-            "evaluation plan", "setup", "metrics",
-        ]
-        wants_guidelines = any(k in lower_q for k in mentorship_triggers)
-        wants_literature = any(k in lower_q for k in literature_triggers)
-        wants_experiments = any(k in lower_q for k in experiment_triggers)
+        deps = _enrichment_deps()
+        _has_att, _att_search = deps.has_attachments, deps.search
+        _guidelines_tool, _exp_plan = deps.guidelines_tool, deps.experiment_planner
+        wants_guidelines = _MENTORSHIP_RE.search(user) is not None
+        wants_literature = _LITERATURE_RE.search(user) is not None
+        wants_experiments = _EXPERIMENT_RE.search(user) is not None
 
         if not _has_att():
             return user
@@ -140,9 +169,11 @@ def build_react_enhanced_input(user: str, session_logger: SessionLogManager) ->
         for r in results[:6]:
             file = r.get("file", "file.pdf")
             page = r.get("page", 1)
-            text = (r.get("text", "") or "").strip().replace("\n", " ")
-            if len(text) > 220:
-                text = text[:220] + "…"
+            # Only the first 220 chars are shown; don't copy the whole page to get them
+            raw = (r.get("text") or "").strip()
+            text = raw[:220].replace("\n", " ").rstrip()
+            if len(raw) > 220:
+                text += "…"
             lines.append(f"- [{file}:{page}] {text}")
 
         if wants_guidelines:
@@ -175,14 +206,8 @@ def build_react_enhanced_input(user: str, session_logger: SessionLogManager) ->
             except Exception as exc:  # pragma: no cover - best effort logging
                 session_logger.log_event("experiment_preview_error", {"error": str(exc)})
 
-        context_block = "\n".join(lines)
-        enhanced = (
-            f"{context_block}\n\n"
-            f"Instruction: Ground your answer FIRST on the attached PDF context above when making claims; "
-            f"include [file:page] citations. THEN, if it strengthens mentorship advice, incorporate insights from the "
-            f"guidelines and literature context (summarize briefly and avoid over-citation).\n\n"
-            f"User Question: {user}"
-        )
+        lines.extend(("", _GROUNDING_INSTRUCTION, "", f"User Question: {user}"))
+        enhanced = "\n".join(lines)
         session_logger.log_event("input_enriched", {"mode": "react", "length": len(enhanced)})
         return enhanced
     except Exception as exc:  # pragma: no cover - defensive path
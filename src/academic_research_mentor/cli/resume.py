@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 import json
+import os
 from typing import Any, Optional, Iterable, List
 
 from ..rich_formatter import print_info, get_formatter
@@ -16,15 +17,29 @@ def _is_primary_chat_log(path: Path) -> bool:
 
 
 def _collect_chat_logs(log_dir: Path) -> List[Path]:
-    collected: List[Path] = []
-    for candidate in log_dir.glob("**/chat_*.json"):
-        if _is_primary_chat_log(candidate):
-            try:
-                collected.append(candidate.resolve())
-            except FileNotFoundError:
-                continue
-    collected.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-    return collected
+    # Walk with scandir so each entry's type and mtime come from one cached stat
+    collected: List[tuple[float, Path]] = []
+    pending = [str(log_dir)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            pending.append(entry.path)
+                        elif (
+                            entry.name.startswith("chat_")
+                            and entry.name.endswith(".json")
+                            and not entry.name.endswith("_session.json")
+                            and entry.is_file()
+                        ):
+                            collected.append((entry.stat().st_mtime, Path(entry.path).resolve()))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    collected.sort(key=lambda item: item[0], reverse=True)
+    return [path for _mtime, path in collected]
 
 
 def _resolve_log_path(raw: Path) -> Optional[Path]:
@@ -39,6 +54,14 @@ def _resolve_log_path(raw: Path) -> Optional[Path]:
     return None
 
 
+def _parse_turns(text: str) -> list:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        # Chat logs are streamed; an interrupted session lacks the closing "]"
+        return json.loads(text.rstrip().rstrip(",") + "\n]")
+
+
 def _load_turns_from_path(path: Optional[str]) -> tuple[list[dict], Optional[Path]]:
     p: Optional[Path]
     if path:
@@ -58,8 +81,7 @@ def _load_turns_from_path(path: Optional[str]) -> tuple[list[dict], Optional[Pat
             return [], None
 
     try:
-        with open(p, "r", encoding="utf-8") as f:
-            turns = json.load(f)
+        turns = _parse_turns(p.read_text(encoding="utf-8"))
         # Filter to real turns
         filtered = [
             t for t in turns
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import signal
 import sys
+from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
@@ -12,25 +13,32 @@ from ..chat_logger import ChatLogger
 from ..session_logging import SessionLogManager, set_active_session_logger
 
 
+# (cwd, discovered .env path) from the last successful walk
+_ENV_PATH: tuple[Path, Path] | None = None
+
+
 def load_env_file() -> None:
+    global _ENV_PATH
     debug_env = os.environ.get("ARM_DEBUG_ENV", "").lower() in ("1", "true", "yes")
 
     try:
-        if os.path.exists(".env"):
-            load_dotenv(".env", verbose=False, override=False)
+        cwd = Path.cwd()
+        candidates = [_ENV_PATH[1]] if _ENV_PATH and _ENV_PATH[0] == cwd else []
+        candidates.extend(d / ".env" for d in (cwd, *cwd.parents))
+        for env_path in candidates:
+            # EAFP: one open() per ancestor instead of exists() + open()
+            try:
+                with open(env_path, encoding="utf-8") as fh:
+                    load_dotenv(stream=fh, verbose=False, override=False)
+            except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+                continue
+            _ENV_PATH = (cwd, env_path)
             if debug_env:
-                print(f"Debug: Loaded .env from current directory: {os.path.abspath('.env')}")
-            return
-
-        current_dir = os.getcwd()
-        while current_dir != os.path.dirname(current_dir):
-            env_path = os.path.join(current_dir, ".env")
-            if os.path.exists(env_path):
-                load_dotenv(env_path, verbose=False, override=False)
-                if debug_env:
+                if env_path.parent == cwd:
+                    print(f"Debug: Loaded .env from current directory: {env_path}")
+                else:
                     print(f"Debug: Loaded .env from: {env_path}")
-                return
-            current_dir = os.path.dirname(current_dir)
+            return
 
         if debug_env:
             print("Debug: No .env file found, using system environment variables only")
@@ -2,56 +2,108 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import re
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from dotenv import load_dotenv
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 
-from academic_research_mentor.agent import MentorAgent, ToolRegistry, create_default_tools
-from academic_research_mentor.llm import create_client
+if TYPE_CHECKING:
+    from academic_research_mentor.agent import MentorAgent
 
 
 console = Console()
 
+_FALLBACK_INSTRUCTIONS = "You are a helpful research mentor."
+
 
 def load_system_prompt() -> str:
     """Load system prompt from prompt.md."""
     try:
         from academic_research_mentor.prompts_loader import load_instructions_from_prompt_md
         instructions, _ = load_instructions_from_prompt_md("mentor", ascii_normalize=False)
-        return instructions or "You are a helpful research mentor."
+        return instructions or _FALLBACK_INSTRUCTIONS
     except Exception:
-        return "You are a helpful research mentor."
+        return _FALLBACK_INSTRUCTIONS
 
 
-def print_response(content: str) -> None:
-    """Print formatted response."""
-    # Parse thinking blocks
-    thinking = None
+_THINKING_RE = re.compile(r"<thinking>(.*?)</thinking>", re.DOTALL)
+
+
+def _render_response(content: str, reasoning: str = "") -> RenderableType:
+    """Build the renderable for a (possibly partial) response."""
+    thinking = reasoning.strip() or None
     main_content = content
     
+    # Parse thinking blocks
     if "<thinking>" in content and "</thinking>" in content:
-        import re
-        match = re.search(r"<thinking>(.*?)</thinking>", content, re.DOTALL)
+        match = _THINKING_RE.search(content)
         if match:
             thinking = match.group(1).strip()
-            main_content = re.sub(r"<thinking>.*?</thinking>", "", content, flags=re.DOTALL).strip()
+            main_content = _THINKING_RE.sub("", content).strip()
     
-    # Print thinking block if present
-    if thinking:
-        console.print(Panel(
+    if not thinking:
+        return Markdown(main_content)
+    return Group(
+        Panel(
             thinking,
             title="[yellow]Thinking[/yellow]",
             border_style="yellow",
             expand=False
-        ))
-    
-    # Print main response
-    console.print(Markdown(main_content))
+        ),
+        Markdown(main_content),
+    )
+
+
+def print_response(content: str) -> None:
+    """Print formatted response."""
+    console.print(_render_response(content))
+
+
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Return the REPL's long-lived event loop.
+
+    The agent's AsyncOpenAI client keeps an httpx connection pool bound to
+    the loop it first ran on, so every turn must reuse the same loop rather
+    than spinning up a fresh one with ``asyncio.run``.
+    """
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+    return _LOOP
+
+
+def stream_response(agent: MentorAgent, user_input: str) -> str:
+    """Render the response incrementally as tokens arrive and return the full text."""
+    content = ""
+    reasoning = ""
+
+    async def _consume(live: Live) -> None:
+        nonlocal content, reasoning
+        async for chunk in agent.stream_async(user_input):
+            if chunk.tool_status == "calling":
+                live.console.print(f"[dim]{chunk.content}[/dim]")
+                continue
+            if chunk.tool_status:
+                continue
+            if chunk.reasoning:
+                reasoning += chunk.reasoning
+            if chunk.content:
+                content += chunk.content
+            live.update(_render_response(content, reasoning))
+
+    with Live(console=console, refresh_per_second=12, vertical_overflow="visible") as live:
+        _event_loop().run_until_complete(_consume(live))
+        live.update(_render_response(content, reasoning))
+    return content
 
 
 def repl(agent: MentorAgent) -> None:
@@ -98,14 +150,16 @@ def repl(agent: MentorAgent) -> None:
         console.print("\n[bold green]Mentor:[/bold green]")
         
         try:
-            response = agent.chat(user_input)
-            print_response(response)
+            stream_response(agent, user_input)
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
 
 
 def main() -> None:
     """Main entry point."""
+    # Deferred so `import cli_simple` stays cheap; only main() needs these
+    from dotenv import load_dotenv
+
     load_dotenv()
     
     # Check for API key
@@ -114,6 +168,9 @@ def main() -> None:
         console.print("Set OPENROUTER_API_KEY or OPENAI_API_KEY in your .env file")
         sys.exit(1)
     
+    from academic_research_mentor.agent import MentorAgent, ToolRegistry, create_default_tools
+    from academic_research_mentor.llm import create_client
+
     # Initialize tools
     tool_registry = ToolRegistry()
     tools_loaded = []
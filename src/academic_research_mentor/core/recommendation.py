@@ -17,6 +17,23 @@ PRIMARY_NAMES = {"web_search"}
 LEGACY_PREFIX = "legacy_"
 GUIDELINES_NAMES = {"research_guidelines"}
 
+# Lookup tables built once at import; score_tools runs them for every tool
+_LITERATURE_KWS = ("literature", "papers", "search", "review", "arxiv", "openreview")
+_GUIDELINES_KWS = (
+    "methodology", "advice", "guidance", "mentor", "best practices",
+    "research taste", "problem selection", "academic", "phd", "career",
+    "how to", "how can i", "getting started", "get started", "start writing a paper",
+    "first steps", "roadmap", "strategy", "planning", "principles", "develop",
+    "judgment", "intuition", "evaluating", "quality", "taste", "developing"
+)
+_MENTORSHIP_KWS = (
+    "research taste", "develop", "methodology", "advice", "guidance", "mentor",
+    "how to", "how can i", "getting started", "get started", "start writing a paper",
+    "first steps", "roadmap", "judgment", "intuition"
+)
+_EXPLICIT_ARXIV_KWS = ("arxiv search", "arxiv papers", "search arxiv")
+_COST_PENALTY = {"low": 0.0, "medium": -0.1, "high": -0.3}
+
 
 def _keyword_match_score(goal: str, tool_name: str) -> float:
     g = goal.lower()
@@ -25,19 +42,12 @@ def _keyword_match_score(goal: str, tool_name: str) -> float:
         score += 0.5
     
     # Literature search keywords
-    for kw in ("literature", "papers", "search", "review", "arxiv", "openreview"):
+    for kw in _LITERATURE_KWS:
         if kw in g:
             score += 0.2
     
     # Research guidelines keywords
-    guidelines_keywords = (
-        "methodology", "advice", "guidance", "mentor", "best practices",
-        "research taste", "problem selection", "academic", "phd", "career",
-        "how to", "how can i", "getting started", "get started", "start writing a paper",
-        "first steps", "roadmap", "strategy", "planning", "principles", "develop",
-        "judgment", "intuition", "evaluating", "quality", "taste", "developing"
-    )
-    for kw in guidelines_keywords:
+    for kw in _GUIDELINES_KWS:
         if kw in g:
             score += 0.8  # Much higher weight for guidelines-specific terms to override primary bonus
     
@@ -49,10 +59,10 @@ def _metadata_score(meta: Dict[str, Any]) -> float:
     quality = meta.get("quality", {}) if isinstance(meta, dict) else {}
     rel = quality.get("reliability_score")
     if isinstance(rel, (int, float)):
-        s += min(max(rel, 0.0), 1.0)  # clamp 0..1
+        s += 0.0 if rel < 0.0 else 1.0 if rel > 1.0 else rel  # clamp 0..1
     operational = meta.get("operational", {}) if isinstance(meta, dict) else {}
     cost = str(operational.get("cost_estimate", "unknown"))
-    cost_penalty = {"low": 0.0, "medium": -0.1, "high": -0.3}.get(cost, -0.05)
+    cost_penalty = _COST_PENALTY.get(cost, -0.05)
     s += cost_penalty
     return s
 
@@ -63,6 +73,7 @@ def score_tools(goal: str, tools: Dict[str, Any]) -> List[Tuple[str, float, str]
     tools: name -> tool instance exposing can_handle() and get_metadata().
     """
     results: List[Tuple[str, float, str]] = []
+    g_lower = goal.lower()
     for name, tool in tools.items():
         try:
             if not getattr(tool, "can_handle", lambda *_: True)({"goal": goal}):
@@ -73,22 +84,14 @@ def score_tools(goal: str, tools: Dict[str, Any]) -> List[Tuple[str, float, str]
             # Base priority - guidelines tool gets priority for mentorship queries
             if name in GUIDELINES_NAMES:
                 # Check if this is a mentorship/guidance query
-                g_lower = goal.lower()
-                mentorship_keywords = [
-                    "research taste", "develop", "methodology", "advice", "guidance", "mentor",
-                    "how to", "how can i", "getting started", "get started", "start writing a paper",
-                    "first steps", "roadmap", "judgment", "intuition"
-                ]
-                if any(kw in g_lower for kw in mentorship_keywords):
+                if any(kw in g_lower for kw in _MENTORSHIP_KWS):
                     score += 1.5  # High priority for guidelines tool on mentorship queries
                     rationale_parts.append("guidelines_priority")
                 else:
                     score += 0.2
             elif name in PRIMARY_NAMES:
                 # Check if this is an explicit arxiv search
-                g_lower = goal.lower()
-                explicit_arxiv_keywords = ["arxiv search", "arxiv papers", "search arxiv"]
-                if any(kw in g_lower for kw in explicit_arxiv_keywords):
+                if any(kw in g_lower for kw in _EXPLICIT_ARXIV_KWS):
                     score += 0.9  # Higher priority for explicit arxiv searches
                     rationale_parts.append("explicit_arxiv_priority")
                 else:
@@ -98,6 +98,10 @@ _STAGE_DEFS: Dict[str, Tuple[str, List[str]]] = {
 }
 
 
+# Weak stage hints used only to nudge confidence when no keyword matched
+_FALLBACK_HINTS: Tuple[str, ...] = ("idea", "plan", "draft", "submit")
+
+
 def detect_stage(user_text: str) -> Dict[str, object]:
     """Detect an approximate research stage for the current user turn.
 
@@ -110,11 +114,9 @@ def detect_stage(user_text: str) -> Dict[str, object]:
     best_code = "A"
     best_score = 0
     total_hits = 0
+    contains = text.__contains__
     for code, (name, keywords) in _STAGE_DEFS.items():
-        score = 0
-        for kw in keywords:
-            if kw in text:
-                score += 1
+        score = sum(map(contains, keywords))
         total_hits += score
         if score > best_score:
             best_score = score
@@ -122,7 +124,7 @@ def detect_stage(user_text: str) -> Dict[str, object]:
 
     # Confidence: basic normalization by hits
     if best_score == 0:
-        conf = 0.35 if any(w in text for w in ("idea", "plan", "draft", "submit")) else 0.30
+        conf = 0.35 if any(map(contains, _FALLBACK_HINTS)) else 0.30
     else:
         conf = min(0.9, 0.45 + 0.1 * best_score)
 
@@ -9,6 +9,9 @@ Transparency scaffolding with optional persistence and simple event streaming.
 """
 
 from dataclasses import dataclass, asdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import heapq
+import threading
 from typing import Any, Dict, List, Optional
 import time
 import os
@@ -42,6 +45,11 @@ class TransparencyStore:
     def __init__(self) -> None:
         self._runs: Dict[str, ToolRun] = {}
         self._listeners: List[Any] = []  # callables receiving event dicts
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: List[Future] = []
+        # Tool calls end runs from several threads; guards _writer/_pending_writes
+        self._writer_lock = threading.Lock()
+        self._persist_dir_ready = False
         # Persistence toggles
         self._persist_enabled = os.getenv("FF_TRANSPARENCY_PERSIST", "false").lower() in (
             "1",
@@ -106,10 +114,13 @@ class TransparencyStore:
         # Persist final run snapshot if enabled
         if self._persist_enabled:
             try:
-                self._persist_dir.mkdir(parents=True, exist_ok=True)
-                out_path = self._persist_dir / f"{run.run_id}.json"
-                with out_path.open("w", encoding="utf-8") as f:
-                    json.dump(self._serialize_run(run), f, ensure_ascii=False, indent=2)
+                # Snapshot now; the disk write happens off the tool's thread
+                snapshot = self._serialize_run(run)
+                with self._writer_lock:
+                    if self._writer is None:
+                        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transparency-persist")
+                    self._pending_writes = [f for f in self._pending_writes if not f.done()]
+                    self._pending_writes.append(self._writer.submit(self._write_snapshot, snapshot))
             except Exception:
                 # Persistence is best-effort; ignore errors
                 pass
@@ -126,9 +137,13 @@ class TransparencyStore:
     def get_run(self, run_id: str) -> Optional[ToolRun]:
         return self._runs.get(run_id)
 
-    def list_runs(self) -> List[ToolRun]:
-        # Most-recent first
-        return sorted(self._runs.values(), key=lambda r: r.started_ms, reverse=True)
+    def list_runs(self, limit: Optional[int] = None) -> List[ToolRun]:
+        # Most-recent first; with a limit, select the top runs without sorting them all
+        key = lambda r: r.started_ms  # noqa: E731
+        runs = list(self._runs.values())  # snapshot; other threads may add runs
+        if limit is not None:
+            return heapq.nlargest(max(0, int(limit)), runs, key=key)
+        return sorted(runs, key=key, reverse=True)
 
     # --- Convenience helpers for export ---
     def _serialize_run(self, run: ToolRun) -> Dict[str, Any]:
@@ -144,20 +159,35 @@ class TransparencyStore:
         }
 
     def as_dicts(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        runs = self.list_runs()
-        if limit is not None:
-            runs = runs[: max(0, int(limit))]
-        return [self._serialize_run(r) for r in runs]
+        return [self._serialize_run(r) for r in self.list_runs(limit)]
+
+    def _write_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        try:
+            if not self._persist_dir_ready:
+                self._persist_dir.mkdir(parents=True, exist_ok=True)
+                self._persist_dir_ready = True
+            out_path = self._persist_dir / f"{snapshot['run_id']}.json"
+            with out_path.open("w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        except Exception:
+            pass
 
     def persisted_as_dicts(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         if not self._persist_enabled:
             return []
         try:
+            # Make runs ended so far visible on disk before listing
+            with self._writer_lock:
+                pending = list(self._pending_writes)
+            wait(pending)
             if not self._persist_dir.exists():
                 return []
-            files = sorted(self._persist_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+            mtime = lambda p: p.stat().st_mtime  # noqa: E731
+            candidates = self._persist_dir.glob("*.json")
             if limit is not None:
-                files = files[: max(0, int(limit))]
+                files = heapq.nlargest(max(0, int(limit)), candidates, key=mtime)
+            else:
+                files = sorted(candidates, key=mtime, reverse=True)
             out: List[Dict[str, Any]] = []
             for fp in files:
                 try:
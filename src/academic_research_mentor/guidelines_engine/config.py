@@ -1,6 +1,7 @@
 """Configuration for guidelines engine."""
 
 import os
+from dataclasses import dataclass, field
 from typing import List, Optional
 from enum import Enum
 
@@ -11,57 +12,66 @@ class GuidelinesMode(Enum):
     DYNAMIC = "dynamic"
 
 
+def _get_guidelines_mode() -> GuidelinesMode:
+    """Get guidelines mode from environment.
+
+    Default to 'dynamic' so fresh clones prefer the Guidelines Tool.
+    """
+    mode_str = os.getenv('ARM_GUIDELINES_MODE', 'dynamic').lower()
+    if mode_str == GuidelinesMode.OFF.value:
+        return GuidelinesMode.OFF
+    return GuidelinesMode.DYNAMIC
+
+
+def _get_max_guidelines() -> Optional[int]:
+    """Get maximum guidelines count from environment."""
+    max_str = os.getenv('ARM_GUIDELINES_MAX')
+    if max_str:
+        try:
+            return int(max_str)
+        except ValueError:
+            pass
+    return None
+
+
+def _get_categories_filter() -> Optional[List[str]]:
+    """Get categories filter from environment."""
+    categories_str = os.getenv('ARM_GUIDELINES_CATEGORIES')
+    if categories_str:
+        # Split by comma and clean up whitespace
+        return [cat.strip() for cat in categories_str.split(',') if cat.strip()]
+    return None
+
+
+def _get_format_style() -> str:
+    """Get format style from environment."""
+    return os.getenv('ARM_GUIDELINES_FORMAT', 'comprehensive')
+
+
+def _get_include_stats() -> bool:
+    """Get whether to include stats in guidelines."""
+    return os.getenv('ARM_GUIDELINES_INCLUDE_STATS', 'false').lower() in ('true', '1', 'yes')
+
+
+def _get_guidelines_path() -> Optional[str]:
+    """Get custom guidelines file path from environment."""
+    return os.getenv('ARM_GUIDELINES_PATH')
+
+
+@dataclass(frozen=True, slots=True)
 class GuidelinesConfig:
-    """Configuration class for guidelines engine."""
-    
-    def __init__(self):
-        """Initialize configuration from environment variables."""
-        self.mode = self._get_guidelines_mode()
-        self.max_guidelines = self._get_max_guidelines()
-        self.categories = self._get_categories_filter()
-        self.format_style = self._get_format_style()
-        self.include_stats = self._get_include_stats()
-        self.guidelines_path = self._get_guidelines_path()
-    
-    def _get_guidelines_mode(self) -> GuidelinesMode:
-        """Get guidelines mode from environment.
-
-        Default to 'dynamic' so fresh clones prefer the Guidelines Tool.
-        """
-        mode_str = os.getenv('ARM_GUIDELINES_MODE', 'dynamic').lower()
-        if mode_str == GuidelinesMode.OFF.value:
-            return GuidelinesMode.OFF
-        return GuidelinesMode.DYNAMIC
-    
-    def _get_max_guidelines(self) -> Optional[int]:
-        """Get maximum guidelines count from environment."""
-        max_str = os.getenv('ARM_GUIDELINES_MAX')
-        if max_str:
-            try:
-                return int(max_str)
-            except ValueError:
-                pass
-        return None
-    
-    def _get_categories_filter(self) -> Optional[List[str]]:
-        """Get categories filter from environment."""
-        categories_str = os.getenv('ARM_GUIDELINES_CATEGORIES')
-        if categories_str:
-            # Split by comma and clean up whitespace
-            return [cat.strip() for cat in categories_str.split(',') if cat.strip()]
-        return None
-    
-    def _get_format_style(self) -> str:
-        """Get format style from environment."""
-        return os.getenv('ARM_GUIDELINES_FORMAT', 'comprehensive')
-    
-    def _get_include_stats(self) -> bool:
-        """Get whether to include stats in guidelines."""
-        return os.getenv('ARM_GUIDELINES_INCLUDE_STATS', 'false').lower() in ('true', '1', 'yes')
-    
-    def _get_guidelines_path(self) -> Optional[str]:
-        """Get custom guidelines file path from environment."""
-        return os.getenv('ARM_GUIDELINES_PATH')
+    """Configuration for guidelines engine, read from environment on creation.
+
+    Instances are immutable and slot-backed; build a new one to pick up
+    environment changes.
+    """
+
+    mode: GuidelinesMode = field(default_factory=_get_guidelines_mode)
+    max_guidelines: Optional[int] = field(default_factory=_get_max_guidelines)
+    categories: Optional[List[str]] = field(default_factory=_get_categories_filter)
+    format_style: str = field(default_factory=_get_format_style)
+    include_stats: bool = field(default_factory=_get_include_stats)
+    guidelines_path: Optional[str] = field(default_factory=_get_guidelines_path)
     
     @property
     def is_enabled(self) -> bool:
@@ -83,4 +93,4 @@ class GuidelinesConfig:
             'include_stats': self.include_stats,
             'guidelines_path': self.guidelines_path,
             'is_enabled': self.is_enabled
-        }
\ No newline at end of file
+        }
@@ -1,8 +1,20 @@
 """Guidelines formatter for converting guidelines into prompt-ready text."""
 
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 
 
+@lru_cache(maxsize=1)
+def _get_encoder() -> Any:
+    """Return a tiktoken encoder if the package is installed, else None."""
+    try:
+        import tiktoken  # type: ignore
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
 class GuidelinesFormatter:
     """Formats research mentorship guidelines for injection into prompts."""
     
@@ -206,7 +218,13 @@ class GuidelinesFormatter:
             text: Formatted guidelines text
         
         Returns:
-            Estimated token count (rough approximation)
+            Token count from tiktoken when available, else a rough approximation
         """
+        encoder = _get_encoder()
+        if encoder is not None:
+            try:
+                return len(encoder.encode(text))
+            except Exception:
+                pass
         # Rough approximation: 4 characters per token on average
         return len(text) // 4
\ No newline at end of file
@@ -2,10 +2,18 @@
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 
+@lru_cache(maxsize=4)
+def _read_guidelines_json(path: str, mtime_ns: int) -> Any:
+    """Parse a guidelines file once per (path, mtime); loaders share the result."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 class GuidelinesLoader:
     """Loads and parses unified research mentorship guidelines."""
     
@@ -18,6 +26,7 @@ class GuidelinesLoader:
         """
         self.guidelines_path = guidelines_path or self._find_guidelines_file()
         self._guidelines_cache: Optional[List[Dict[str, Any]]] = None
+        self._by_category: Optional[Dict[Any, List[Dict[str, Any]]]] = None
     
     def _find_guidelines_file(self) -> str:
         """Find the unified_guidelines.json file in expected locations."""
@@ -56,8 +65,7 @@ class GuidelinesLoader:
             return self._guidelines_cache
         
         try:
-            with open(self.guidelines_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_guidelines_json(self.guidelines_path, os.stat(self.guidelines_path).st_mtime_ns)
             
             # Handle both direct array and wrapper object formats
             if isinstance(data, list):
@@ -82,8 +90,16 @@ class GuidelinesLoader:
         Returns:
             List of guidelines matching the category
         """
-        guidelines = self.load_guidelines()
-        return [g for g in guidelines if g.get('category') == category]
+        return list(self._category_index().get(category, []))
+    
+    def _category_index(self) -> Dict[Any, List[Dict[str, Any]]]:
+        """Group guidelines by category in a single pass, built once per loader."""
+        if self._by_category is None:
+            index: Dict[Any, List[Dict[str, Any]]] = {}
+            for guideline in self.load_guidelines():
+                index.setdefault(guideline.get('category'), []).append(guideline)
+            self._by_category = index
+        return self._by_category
     
     def get_guidelines_by_tags(self, tags: List[str]) -> List[Dict[str, Any]]:
         """Get guidelines that contain any of the specified tags.
@@ -137,12 +153,7 @@ class GuidelinesLoader:
         Returns:
             List of unique category names
         """
-        guidelines = self.load_guidelines()
-        categories = set()
-        for guideline in guidelines:
-            if 'category' in guideline:
-                categories.add(guideline['category'])
-        return sorted(list(categories))
+        return sorted(c for c in self._category_index() if c is not None)
     
     def get_all_tags(self) -> List[str]:
         """Get all unique tags across all guidelines.
@@ -175,10 +186,9 @@ class GuidelinesLoader:
         }
         
         # Count guidelines per category
+        index = self._category_index()
         for category in categories:
-            stats['category_breakdown'][category] = len(
-                self.get_guidelines_by_category(category)
-            )
+            stats['category_breakdown'][category] = len(index[category])
         
         # Get unique types
         types = set()
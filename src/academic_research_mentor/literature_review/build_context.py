@@ -12,10 +12,43 @@ from .context_format import build_agent_context
 from .debug import should_debug_log, init_debug_logging, save_debug_log
 
 
-def build_research_context(user_input: str) -> Dict[str, Any]:
-    start_time = time.time()
+_NO_CONTEXT_TEMPLATE: Dict[str, Any] = {
+    "has_research_context": False,
+    "has_literature": False,
+    "is_llm_only": False,
+    "grounding": "none",
+    "literature_summary": "",
+    "search_performed": False,
+    "processing_time": 0.0,
+}
+
+
+def _no_context_result(intent: Dict[str, Any], user_input: str) -> Dict[str, Any]:
+    result = _NO_CONTEXT_TEMPLATE.copy()
+    result["intent"] = intent
+    # Fresh lists per result so callers can extend them safely
+    result["key_papers"] = []
+    result["research_gaps"] = []
+    result["trending_topics"] = []
+    result["recommendations"] = []
+    result["context_for_agent"] = f"No research intent detected in: '{user_input}'. Proceed with general conversation."
+    return result
+
 
+def build_research_context(user_input: str) -> Dict[str, Any]:
     debug_log = init_debug_logging(user_input) if should_debug_log() else None
+    # The debug log accumulates in memory and is written once at a terminal
+    # stage; a failure part-way still persists what was gathered so far.
+    try:
+        return _build_research_context(user_input, debug_log)
+    except Exception:
+        if debug_log is not None:
+            save_debug_log(debug_log, "error")
+        raise
+
+
+def _build_research_context(user_input: str, debug_log: Dict[str, Any] | None) -> Dict[str, Any]:
+    start_time = time.time()
 
     intent = extract_research_intent(user_input)
 
@@ -28,41 +61,13 @@ def build_research_context(user_input: str) -> Dict[str, Any]:
     if not intent.get("has_research_intent", False):
         if debug_log is not None:
             save_debug_log(debug_log, "no_intent")
-        return {
-            "has_research_context": False,
-            "has_literature": False,
-            "is_llm_only": False,
-            "grounding": "none",
-            "intent": intent,
-            "literature_summary": "",
-            "key_papers": [],
-            "research_gaps": [],
-            "trending_topics": [],
-            "recommendations": [],
-            "search_performed": False,
-            "context_for_agent": f"No research intent detected in: '{user_input}'. Proceed with general conversation.",
-            "processing_time": 0.0,
-        }
+        return _no_context_result(intent, user_input)
 
     topics = intent.get("topics", [])
     if not topics:
         if debug_log is not None:
             save_debug_log(debug_log, "no_topics")
-        return {
-            "has_research_context": False,
-            "has_literature": False,
-            "is_llm_only": False,
-            "grounding": "none",
-            "intent": intent,
-            "literature_summary": "",
-            "key_papers": [],
-            "research_gaps": [],
-            "trending_topics": [],
-            "recommendations": [],
-            "search_performed": False,
-            "context_for_agent": f"No research intent detected in: '{user_input}'. Proceed with general conversation.",
-            "processing_time": 0.0,
-        }
+        return _no_context_result(intent, user_input)
 
     print(f"🔍 Research topics detected: {', '.join(topics)}")
     print("📚 Searching literature...")
@@ -86,7 +91,6 @@ def build_research_context(user_input: str) -> Dict[str, Any]:
                 "timestamp": datetime.now().isoformat(),
                 "reason": "No meaningful results on first attempt",
             }
-            save_debug_log(debug_log, "retry1")
         retry_results = perform_literature_searches(topics, relax=True)
         if has_meaningful_results(retry_results):
             search_results = retry_results
@@ -96,17 +100,18 @@ def build_research_context(user_input: str) -> Dict[str, Any]:
                     "timestamp": datetime.now().isoformat(),
                     "reason": "No meaningful results after retry; using O3-only overview",
                 }
-                save_debug_log(debug_log, "llm_only")
             llm_only = llm_only_overview(user_input=user_input, topics=topics, research_type=intent.get("research_type", "other"))
             agent_context = build_agent_context(intent, llm_only, topics)
             duration = time.time() - start_time
             if debug_log is not None:
+                # Both steps are recorded at the same instant; stamp them once
+                now_iso = datetime.now().isoformat()
                 debug_log.setdefault("steps", {})["step3_llm_only_synthesis"] = {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso,
                     "synthesis_result": llm_only,
                 }
                 debug_log["step4_final"] = {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso,
                     "agent_context_length": len(agent_context),
                     "processing_time": duration,
                 }
@@ -7,7 +7,7 @@ Handles extraction of Citation objects from various literature sources.
 from __future__ import annotations
 
 from typing import List, Dict, Any
-from ..citations import Citation
+from ..citations import Citation, stable_id
 
 
 def extract_citations_from_arxiv(arxiv_results: Dict[str, Any]) -> List[Citation]:
@@ -21,7 +21,7 @@ def extract_citations_from_arxiv(arxiv_results: Dict[str, Any]) -> List[Citation
             
         url = str(paper.get("url", "")).strip()
         title = str(paper.get("title", "")).strip() or "Untitled"
-        cid = f"arxiv_{abs(hash(url or title)) & 0xfffffff:x}"
+        cid = stable_id("arxiv", url or title)
         
         citation = Citation(
             id=cid,
@@ -53,7 +53,7 @@ def extract_citations_from_openreview(openreview_results: Dict[str, Any]) -> Lis
             
         url = str(thread.get("urls", {}).get("paper", "") if thread.get("urls") else "").strip()
         title = str(thread.get("paper_title", "")).strip() or "Untitled"
-        cid = f"openreview_{abs(hash(url or title)) & 0xfffffff:x}"
+        cid = stable_id("openreview", url or title)
         
         citation = Citation(
             id=cid,
@@ -8,11 +8,6 @@ from __future__ import annotations
 import os
 from typing import Optional, Any
 
-try:
-    from langchain_openai import ChatOpenAI  # type: ignore
-except ImportError:
-    ChatOpenAI = None
-
 
 class O3Client:
     """Client for accessing O3 model via OpenRouter."""
@@ -24,13 +19,16 @@ class O3Client:
     
     def _initialize_client(self) -> None:
         """Initialize the O3 client if API key is available."""
-        if not ChatOpenAI:
-            return
-            
         api_key = os.environ.get("OPENROUTER_API_KEY")
         if not api_key:
             return
-            
+
+        # Imported lazily: langchain_openai is slow to load and optional
+        try:
+            from langchain_openai import ChatOpenAI  # type: ignore
+        except ImportError:
+            return
+
         try:
             self._client = ChatOpenAI(
                 model="openai/o3-mini",  # Use O3 mini for better performance
@@ -5,6 +5,24 @@ from typing import Any, Dict, List
 
 from ..mentor_tools import arxiv_search
 
+_QUERY_STOPWORDS = frozenset({
+    "the","and","for","are","but","not","you","all","can","has","have","had",
+    "one","two","new","now","old","see","use","using","with","via","from","into",
+    "scale","scaling","build","building","project","source","open","large","large-scale",
+    "strategy","strategies","resources","models","model","data","collection","sourcing",
+    "curation","strategies","best","practices","mix","available","currently",
+})
+
+_QUERY_PRIORITY = {
+    tok: idx
+    for idx, tok in enumerate(
+        (
+            "multimodal","dataset","lmm","llm","vision-language","vlm","vision","image","text",
+            "arxiv","pdf","html","pretraining","pretrain","benchmark","survey",
+        )
+    )
+}
+
 
 def topics_to_search_query(topics: List[str]) -> str:
     import re
@@ -30,28 +48,9 @@ def topics_to_search_query(topics: List[str]) -> str:
             seen.add(t)
             tokens.append(t)
 
-    stop = {
-        "the","and","for","are","but","not","you","all","can","has","have","had",
-        "one","two","new","now","old","see","use","using","with","via","from","into",
-        "scale","scaling","build","building","project","source","open","large","large-scale",
-        "strategy","strategies","resources","models","model","data","collection","sourcing",
-        "curation","strategies","best","practices","mix","available","currently",
-    }
-    filtered = [t for t in tokens if t not in stop and len(t) >= 3]
-
-    priority = [
-        "multimodal","dataset","lmm","llm","vision-language","vlm","vision","image","text",
-        "arxiv","pdf","html","pretraining","pretrain","benchmark","survey",
-    ]
-
-    def sort_key(tok: str) -> tuple[int, int]:
-        try:
-            idx = priority.index(tok)
-        except ValueError:
-            idx = len(priority)
-        return (idx, -len(tok))
-
-    ordered = sorted(filtered, key=sort_key)
+    filtered = [t for t in tokens if t not in _QUERY_STOPWORDS and len(t) >= 3]
+    fallback = len(_QUERY_PRIORITY)
+    ordered = sorted(filtered, key=lambda tok: (_QUERY_PRIORITY.get(tok, fallback), -len(tok)))
     core = ordered[:5] if ordered else (tokens[:5] if tokens else [])
     return " ".join(core) or " ".join((topics or [])[:3])
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 from dataclasses import dataclass
 from typing import Any, AsyncIterator, Optional
@@ -121,6 +122,10 @@ class LLMClient:
             **kwargs
         )
 
+        # Tool-call deltas arrive in fragments keyed by index; assemble them
+        # and emit the finished calls as one chunk after the stream ends.
+        pending_calls: dict[int, dict[str, str]] = {}
+
         async for chunk in stream:
             if not chunk.choices:
                 continue
@@ -128,6 +133,15 @@ class LLMClient:
             choice = chunk.choices[0]
             delta = choice.delta
 
+            for tc in getattr(delta, "tool_calls", None) or []:
+                slot = pending_calls.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+                if tc.id:
+                    slot["id"] = tc.id
+                fn = getattr(tc, "function", None)
+                if fn is not None:
+                    slot["name"] += fn.name or ""
+                    slot["arguments"] += fn.arguments or ""
+
             # Extract reasoning if available (OpenRouter)
             reasoning = None
             if hasattr(delta, "reasoning_content") and delta.reasoning_content:
@@ -154,6 +168,20 @@ class LLMClient:
                 finish_reason=choice.finish_reason
             )
 
+        if pending_calls:
+            yield StreamChunk(
+                tool_calls=[_assemble_tool_call(slot) for _, slot in sorted(pending_calls.items())],
+                finish_reason="tool_calls",
+            )
+
+
+def _assemble_tool_call(slot: dict[str, str]) -> ToolCall:
+    try:
+        arguments = json.loads(slot["arguments"] or "{}")
+    except ValueError:
+        arguments = {}
+    return ToolCall(id=slot["id"], name=slot["name"], arguments=arguments)
+
 
 def create_client(
     provider: str = "openrouter",
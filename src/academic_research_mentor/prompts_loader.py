@@ -4,6 +4,7 @@ import os
 import re
 import unicodedata
 from contextlib import suppress
+from functools import lru_cache
 from importlib import resources as pkg_resources
 from typing import Optional, Tuple, Any
 
@@ -49,15 +50,37 @@ def load_instructions_from_prompt_md(variant: str, ascii_normalize: bool) -> Tup
     if text is None:
         return None, variant
 
+    block = _prepare_block(text, ascii_normalize)
+    if block is None:
+        return None, variant
+
+    # Inject guidelines if available and enabled
+    if GUIDELINES_AVAILABLE:
+        try:
+            injector = create_guidelines_injector()
+            block = injector.inject_guidelines(block)
+        except Exception as e:
+            # Log warning but don't break functionality
+            print(f"Warning: Failed to inject guidelines: {e}")
+
+    return block.strip(), "unified"
+
+
+@lru_cache(maxsize=8)
+def _prepare_block(text: str, ascii_normalize: bool) -> Optional[str]:
+    """Parse and normalize the prompt body; cached per (file content, ascii flag).
+
+    Guidelines injection stays outside the cache because it depends on ARM_GUIDELINES_* env.
+    """
     # Extract content after the main heading
     heading_re = r"^#\s+Research\s+Mentor\s+System\s+Prompt.*$"
     m = re.search(heading_re, text, flags=re.MULTILINE)
     if not m:
-        return None, variant
+        return None
 
     # Get all content after the main heading
     tail = text[m.end():].strip()
-    
+
     # Normalize the content
     block = _normalize_whitespace(tail)
     if ascii_normalize:
@@ -65,17 +88,14 @@ def load_instructions_from_prompt_md(variant: str, ascii_normalize: bool) -> Tup
 
     if len(block) > 12000:
         block = _trim_low_signal_sections(block)
+    return block
 
-    # Inject guidelines if available and enabled
-    if GUIDELINES_AVAILABLE:
-        try:
-            injector = create_guidelines_injector()
-            block = injector.inject_guidelines(block)
-        except Exception as e:
-            # Log warning but don't break functionality
-            print(f"Warning: Failed to inject guidelines: {e}")
 
-    return block.strip(), "unified"
+@lru_cache(maxsize=4)
+def _read_prompt_file(path: str, mtime_ns: int) -> str:
+    # mtime_ns is part of the cache key so edits to prompt.md are picked up
+    with open(path, "r", encoding="utf-8") as handle:
+        return handle.read()
 
 
 def _read_candidate(candidate: Any) -> Optional[str]:
@@ -85,8 +105,7 @@ def _read_candidate(candidate: Any) -> Optional[str]:
         path = str(candidate)
         if not os.path.isabs(path):
             path = os.path.abspath(path)
-        with open(path, "r", encoding="utf-8") as handle:
-            return handle.read()
+        return _read_prompt_file(path, os.stat(path).st_mtime_ns)
     except Exception:
         return None
 
@@ -11,6 +11,7 @@ from .rich_ui.io_helpers import (  # noqa: F401
     end_streaming_response,
     print_error,
     print_info,
+    print_info_many,
     print_success,
     print_agent_reasoning,
     print_user_input,
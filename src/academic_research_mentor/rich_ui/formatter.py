@@ -39,6 +39,10 @@ class RichFormatter:
     def print_info(self, message: str) -> None:
         self.console.print(f"[bold blue]Info:[/bold blue] {message}")
 
+    def print_info_many(self, messages: list[str]) -> None:
+        if messages:
+            self.console.print("\n".join(f"[bold blue]Info:[/bold blue] {m}" for m in messages))
+
     def print_success(self, message: str) -> None:
         self.console.print(f"[bold green]Success:[/bold green] {message}")
 
@@ -135,6 +139,9 @@ class SilentRichFormatter(RichFormatter):
     def print_info(self, message: str) -> None:  # noqa: D401
         return
 
+    def print_info_many(self, messages: list[str]) -> None:  # noqa: D401
+        return
+
     def print_success(self, message: str) -> None:  # noqa: D401
         return
 
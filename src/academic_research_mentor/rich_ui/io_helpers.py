@@ -36,6 +36,11 @@ def print_info(message: str) -> None:
     get_formatter().print_info(message)
 
 
+def print_info_many(messages: list[str]) -> None:
+    log_ui_event("print_info_many", {"messages": messages})
+    get_formatter().print_info_many(messages)
+
+
 def print_success(message: str) -> None:
     log_ui_event("print_success", {"message": message})
     get_formatter().print_success(message)
@@ -99,9 +99,12 @@ def web_search_tool_fn(q: str, *, internal_delimiters: tuple[str, str] | None =
         suffix = f" ({year})" if year else ""
         link = f" -> {url}" if url else ""
         if mode == "detailed" and snippet:
-            snippet_txt = snippet.strip().replace("\n", " ")
+            # Truncate before flattening newlines so only the kept prefix is copied
+            snippet_txt = snippet.strip()
             if len(snippet_txt) > 280:
-                snippet_txt = snippet_txt[:280] + "…"
+                snippet_txt = snippet_txt[:280].replace("\n", " ") + "…"
+            else:
+                snippet_txt = snippet_txt.replace("\n", " ")
             lines.append(f"- {title}{suffix}{link}\n  {snippet_txt}")
         else:
             lines.append(f"- {title}{suffix}{link}")
@@ -161,9 +164,11 @@ def experiment_planner_tool_fn(q: str, *, internal_delimiters: tuple[str, str] |
         for i, s in enumerate(snippets[:6], 1):
             anchor = f"[{s.get('file','file.pdf')}:{s.get('page',1)}]"
             base_text = (s.get("text") if detailed else s.get("snippet")) or s.get("text") or ""
-            snippet = base_text.strip().replace("\n", " ")
+            snippet = base_text.strip()
             if not detailed and len(snippet) > 200:
-                snippet = snippet[:200] + "…"
+                snippet = snippet[:200].replace("\n", " ") + "…"
+            else:
+                snippet = snippet.replace("\n", " ")
             context_lines.append(f"{i}. {anchor}: {snippet}")
         
         full_context = "\n".join(context_lines)
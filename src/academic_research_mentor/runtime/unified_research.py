@@ -6,6 +6,7 @@ Handles combining papers and guidelines with [P#] and [G#] citations.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from .tool_helpers import print_agent_reasoning
@@ -23,50 +24,40 @@ def unified_research_tool_fn(query: str, *, internal_delimiters: tuple[str, str]
         auto_discover()
 
         orch = Orchestrator()
-        
-        # Collect papers from arXiv and O3 search
-        paper_results = []
-        
-        # Try arXiv search
-        try:
-            arxiv_result = orch.execute_task(
-                task="legacy_arxiv_search",
-                inputs={"query": query, "limit": 8},
-                context={"goal": f"find papers about {query}"}
-            )
-            if arxiv_result["execution"]["executed"] and arxiv_result["results"]:
-                paper_results.append(arxiv_result["results"])
-        except Exception:
-            pass
-        
-        # Try web search
-        try:
-            web_result = orch.execute_task(
-                task="web_search",
-                inputs={"query": query, "limit": 8},
-                context={"goal": f"find papers about {query}"}
-            )
-            if web_result["execution"]["executed"] and web_result["results"]:
-                paper_results.append(web_result["results"])
-        except Exception:
-            pass
-        
-        # Get guidelines
-        guidelines_result = None
-        try:
-            guidelines_result = orch.execute_task(
-                task="research_guidelines",
-                inputs={
-                    "query": query,
-                    "topic": query,
-                    "response_format": "concise",
-                    "page_size": 20,
-                    "mode": "fast",
-                },
-                context={"goal": f"research mentorship guidance about {query}"}
+
+        def _execute(task: str, inputs: dict[str, Any], goal: str) -> Any:
+            try:
+                return orch.execute_task(task=task, inputs=inputs, context={"goal": goal})
+            except Exception:
+                return None
+
+        paper_goal = f"find papers about {query}"
+        guideline_inputs = {
+            "query": query,
+            "topic": query,
+            "response_format": "concise",
+            "page_size": 20,
+            "mode": "fast",
+        }
+        # arXiv, web search and guidelines are independent network calls; run them together
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            arxiv_future = pool.submit(_execute, "legacy_arxiv_search", {"query": query, "limit": 8}, paper_goal)
+            web_future = pool.submit(_execute, "web_search", {"query": query, "limit": 8}, paper_goal)
+            guidelines_future = pool.submit(
+                _execute, "research_guidelines", guideline_inputs, f"research mentorship guidance about {query}"
             )
-        except Exception:
-            pass
+            arxiv_result = arxiv_future.result()
+            web_result = web_future.result()
+            guidelines_result = guidelines_future.result()
+
+        # Collect papers from arXiv and web search, arXiv first
+        paper_results = []
+        for paper_result in (arxiv_result, web_result):
+            try:
+                if paper_result["execution"]["executed"] and paper_result["results"]:
+                    paper_results.append(paper_result["results"])
+            except Exception:
+                pass
 
         # Extract papers and guidelines
         merger = CitationMerger()
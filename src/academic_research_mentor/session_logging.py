@@ -5,6 +5,32 @@ import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:  # pragma: no cover - optional dependency guard
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    orjson = None  # type: ignore
+
+
+def _dumps_line(event: Dict[str, Any]) -> str:
+    """Serialize one JSONL record, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS).decode("utf-8") + "\n"
+        except TypeError:
+            pass
+    return json.dumps(event, ensure_ascii=False) + "\n"
+
+
+def write_pretty_json(path: Path, payload: Any) -> None:
+    """Write an indented JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
+        except TypeError:
+            pass
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
 
 class SessionLogManager:
     def __init__(self, log_dir: str = "convo-logs") -> None:
@@ -35,6 +61,10 @@ class SessionLogManager:
         self._closed = False
         self._log_event("session_started", {})
 
+    @property
+    def session_dir(self) -> Path:
+        return self._session_dir
+
     def start_turn(self, turn: int, user_prompt: str) -> None:
         self._current_turn = turn
         self._turn_state[turn] = {"user_prompt": user_prompt}
@@ -65,6 +95,11 @@ class SessionLogManager:
         self._metadata[key] = value
         self._flush_metadata()
 
+    def update_metadata(self, values: Dict[str, Any]) -> None:
+        """Merge several metadata keys and rewrite the session file once."""
+        self._metadata.update(values)
+        self._flush_metadata()
+
     def finalize(self, exit_command: str) -> None:
         if self._closed:
             return
@@ -80,7 +115,7 @@ class SessionLogManager:
         self._closed = True
 
     def _flush_metadata(self) -> None:
-        self._session_path.write_text(json.dumps(self._metadata, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_pretty_json(self._session_path, self._metadata)
 
     def _log_event(self, event_type: str, payload: Dict[str, Any], turn: Optional[int] = None) -> None:
         event = {
@@ -91,7 +126,7 @@ class SessionLogManager:
         }
         try:
             if not self._closed:
-                self._events_file.write(json.dumps(event, ensure_ascii=False) + "\n")
+                self._events_file.write(_dumps_line(event))
                 self._events_file.flush()
         except Exception:
             pass
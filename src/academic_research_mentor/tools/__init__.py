@@ -11,6 +11,7 @@ from typing import Dict, Optional, Type
 import importlib
 import pkgutil
 import inspect
+import threading
 
 from .base_tool import BaseTool
 
@@ -20,6 +21,9 @@ class ToolBase(BaseTool):
 
 
 _registry: Dict[str, BaseTool] = {}
+_discovered_packages: set[str] = set()
+# Reentrant: a tool's initialize() may itself trigger discovery
+_discover_lock = threading.RLock()
 
 
 def register_tool(tool: BaseTool) -> None:
@@ -34,12 +38,23 @@ def list_tools() -> Dict[str, BaseTool]:
     return dict(_registry)
 
 
-def auto_discover(package: str = __name__) -> None:
+def auto_discover(package: str = __name__, *, force: bool = False) -> None:
     """Discover and register tools under this package.
 
     Convention: any subpackage containing a module named `tool` with at least
     one subclass of BaseTool will be imported and an instance registered.
+    Discovery runs once per package; later calls keep the registered
+    instances (and their warm caches) unless ``force`` is set.
     """
+    with _discover_lock:
+        if package in _discovered_packages and not force:
+            return
+        _walk_and_register(package)
+        # Marked only after a complete walk so a failed import is retried
+        _discovered_packages.add(package)
+
+
+def _walk_and_register(package: str) -> None:
     # Walk submodules of the tools package recursively
     pkg = importlib.import_module(package)
     for modinfo in pkgutil.walk_packages(pkg.__path__, pkg.__name__ + "."):
@@ -1,15 +1,22 @@
 """
 Caching and cost monitoring utilities for guidelines tool.
 
-Provides file-based caching with TTL and basic cost tracking.
+Provides file-based caching with TTL, a small in-process LRU in front of
+the disk tier, and basic cost tracking.
 """
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import os
+import tempfile
+import threading
 import time
-from datetime import datetime, timedelta
+import weakref
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 import hashlib
@@ -17,6 +24,21 @@ import hashlib
 from .config import GuidelinesConfig
 
 
+def _atomic_write_json(path: Path, payload: Any, **dump_kwargs: Any) -> None:
+    """Write JSON via a temp file + rename so readers never see partial files."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f, **dump_kwargs)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 class GuidelinesCache:
     """File-based cache for guidelines search results."""
     
@@ -25,26 +47,44 @@ class GuidelinesCache:
         self.cache_dir = Path.home() / ".cache" / "academic-research-mentor" / "guidelines"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cost_tracker = CostTracker()
+        # Recently used results kept in RAM: cache_key -> (written_at epoch, result)
+        self._memory: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._memory_size = max(0, int(getattr(config, "MEMORY_CACHE_SIZE", 128)))
+        # Tool calls and orchestrator searches share this cache across threads
+        self._memory_lock = threading.Lock()
+    
+    def _remember(self, cache_key: str, written_at: float, result: Dict[str, Any]) -> None:
+        """Store a result in the in-process LRU, evicting the oldest entries."""
+        if self._memory_size <= 0:
+            return
+        with self._memory_lock:
+            self._memory[cache_key] = (written_at, result)
+            self._memory.move_to_end(cache_key)
+            while len(self._memory) > self._memory_size:
+                self._memory.popitem(last=False)
     
     def _get_cache_key(self, query: str) -> str:
         """Generate cache key for a query."""
-        # Use hash of query to ensure valid filename
-        return hashlib.md5(query.encode()).hexdigest()
+        # Use hash of query to ensure valid filename; blake2b is faster than md5
+        return hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
     
     def _get_cache_path(self, cache_key: str) -> Path:
         """Get file path for cache key."""
         return self.cache_dir / f"{cache_key}.json"
     
+    def _valid_mtime(self, cache_path: Path) -> Optional[float]:
+        """Return the cache file's mtime if it exists and is within TTL."""
+        try:
+            mtime = cache_path.stat().st_mtime
+        except OSError:
+            return None
+        if time.time() - mtime >= self.config.CACHE_TTL_HOURS * 3600:
+            return None
+        return mtime
+
     def _is_cache_valid(self, cache_path: Path) -> bool:
         """Check if cache file is still valid based on TTL."""
-        if not cache_path.exists():
-            return False
-        
-        stat = cache_path.stat()
-        cache_time = datetime.fromtimestamp(stat.st_mtime)
-        expiry_time = datetime.now() - timedelta(hours=self.config.CACHE_TTL_HOURS)
-        
-        return cache_time > expiry_time
+        return self._valid_mtime(cache_path) is not None
     
     def get(self, query: str) -> Optional[Dict[str, Any]]:
         """Get cached result for query."""
@@ -52,15 +92,31 @@ class GuidelinesCache:
             return None
         
         cache_key = self._get_cache_key(query)
+        ttl_secs = self.config.CACHE_TTL_HOURS * 3600
+        with self._memory_lock:
+            entry = self._memory.get(cache_key)
+            if entry is not None:
+                if time.time() - entry[0] < ttl_secs:
+                    self._memory.move_to_end(cache_key)
+                else:
+                    self._memory.pop(cache_key, None)
+                    entry = None
+        if entry is not None:
+            self.cost_tracker.record_cache_hit()
+            # Callers annotate results in place; hand out a private copy
+            return copy.deepcopy(entry[1])
+
         cache_path = self._get_cache_path(cache_key)
         
-        if not self._is_cache_valid(cache_path):
+        mtime = self._valid_mtime(cache_path)
+        if mtime is None:
             return None
         
         try:
             with open(cache_path, 'r') as f:
                 cached_data = json.load(f)
             
+            self._remember(cache_key, mtime, copy.deepcopy(cached_data))
             # Track cache hit
             self.cost_tracker.record_cache_hit()
             return cached_data
@@ -78,8 +134,9 @@ class GuidelinesCache:
         cache_path = self._get_cache_path(cache_key)
         
         try:
-            with open(cache_path, 'w') as f:
-                json.dump(result, f, indent=2)
+            # Compact separators: entries are machine-read only
+            _atomic_write_json(cache_path, result, separators=(",", ":"))
+            self._remember(cache_key, time.time(), copy.deepcopy(result))
             
             # Track cache write
             self.cost_tracker.record_cache_write()
@@ -90,19 +147,51 @@ class GuidelinesCache:
     
     def clear(self) -> None:
         """Clear all cached results."""
+        with self._memory_lock:
+            self._memory.clear()
         for cache_file in self.cache_dir.glob("*.json"):
             cache_file.unlink()
         
         self.cost_tracker.reset()
 
 
+# Trackers alive at interpreter exit are flushed by a single atexit hook;
+# the weak set does not keep discarded trackers (and their caches) alive.
+_live_trackers: "weakref.WeakSet[CostTracker]" = weakref.WeakSet()
+
+
+def _flush_live_trackers() -> None:
+    for tracker in list(_live_trackers):
+        tracker.flush()
+
+
+atexit.register(_flush_live_trackers)
+
+
 class CostTracker:
-    """Track usage costs and cache statistics."""
+    """Track usage costs and cache statistics.
+
+    Counters live in memory; the stats file is rewritten at most once per
+    SAVE_INTERVAL_SECS and flushed at interpreter exit.
+    """
+
+    SAVE_INTERVAL_SECS = 5.0
     
     def __init__(self):
         self.stats_file = Path.home() / ".cache" / "academic-research-mentor" / "guidelines_stats.json"
         self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = 0.0
         self._load_stats()
+        _live_trackers.add(self)
+
+    def __del__(self) -> None:
+        # Trackers collected before exit still write their pending counters
+        try:
+            self.flush()
+        except Exception:
+            pass
     
     def _load_stats(self) -> None:
         """Load statistics from file."""
@@ -126,35 +215,49 @@ class CostTracker:
             "last_updated": datetime.now().isoformat()
         }
     
-    def _save_stats(self) -> None:
-        """Save statistics to file."""
+    def _save_stats(self, force: bool = False) -> None:
+        """Save statistics to file, throttled unless forced."""
+        now = time.time()
+        if not force and now - self._last_save < self.SAVE_INTERVAL_SECS:
+            self._dirty = True
+            return
         try:
             self.stats["last_updated"] = datetime.now().isoformat()
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=2)
+            _atomic_write_json(self.stats_file, self.stats, indent=2)
+            self._dirty = False
+            self._last_save = now
         except Exception:
             pass
+
+    def flush(self) -> None:
+        """Write pending statistics to disk."""
+        with self._lock:
+            if self._dirty:
+                self._save_stats(force=True)
+
+    def _increment(self, field: str, amount: float = 1) -> None:
+        with self._lock:
+            self.stats[field] += amount
+            self._save_stats()
     
     def record_cache_hit(self) -> None:
         """Record a cache hit."""
-        self.stats["cache_hits"] += 1
-        self._save_stats()
+        self._increment("cache_hits")
     
     def record_cache_miss(self) -> None:
         """Record a cache miss."""
-        self.stats["cache_misses"] += 1
-        self._save_stats()
+        self._increment("cache_misses")
     
     def record_cache_write(self) -> None:
         """Record a cache write."""
-        self.stats["cache_writes"] += 1
-        self._save_stats()
+        self._increment("cache_writes")
     
     def record_search_query(self, cost_estimate: float = 0.01) -> None:
         """Record a search query with estimated cost."""
-        self.stats["search_queries"] += 1
-        self.stats["total_cost_estimate"] += cost_estimate
-        self._save_stats()
+        with self._lock:
+            self.stats["search_queries"] += 1
+            self.stats["total_cost_estimate"] += cost_estimate
+            self._save_stats()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get current statistics."""
@@ -169,5 +272,6 @@ class CostTracker:
     
     def reset(self) -> None:
         """Reset all statistics."""
-        self.stats = self._get_default_stats()
-        self._save_stats()
\ No newline at end of file
+        with self._lock:
+            self.stats = self._get_default_stats()
+            self._save_stats(force=True)
\ No newline at end of file
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-from ...citations import Citation, CitationFormatter, CitationValidator
+from ...citations import Citation, CitationFormatter, CitationValidator, stable_id
 
 
 class GuidelinesCitationHandler:
@@ -24,7 +24,7 @@ class GuidelinesCitationHandler:
         for item in evidence:
             url = item.get("url", "")
             title = item.get("title", "Untitled")
-            cid = item.get("evidence_id", f"ev_{abs(hash(url or title)) & 0xfffffff:x}")
+            cid = item.get("evidence_id") or stable_id("ev", url or title)
 
             citation = Citation(
                 id=cid,
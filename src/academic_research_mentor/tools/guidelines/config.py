@@ -7,6 +7,7 @@ and institutions for evidence-based academic mentoring.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, List
 import os
 from urllib.parse import urlparse
@@ -18,6 +19,7 @@ class GuidelinesConfig:
     # Cost Optimization Settings
     ENABLE_CACHING = True
     CACHE_TTL_HOURS = 24  # Cache responses for 24 hours
+    MEMORY_CACHE_SIZE = int(os.getenv("GUIDELINES_MEMORY_CACHE_SIZE", "128"))  # In-process LRU entries
     MAX_SEARCH_QUERIES = 3  # Limit to 3 queries to control costs
     ENABLE_COST_MONITORING = True
 
@@ -131,18 +133,9 @@ class GuidelinesConfig:
         try:
             if url in cls.GUIDELINE_THESES:
                 return cls.GUIDELINE_THESES[url]
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            dom = (parsed.netloc or "").lower()
-            # Try any URL in same domain to inherit a thesis
-            for u, t in cls.GUIDELINE_THESES.items():
-                try:
-                    p = urlparse(u)
-                    if (p.netloc or "").lower() == dom:
-                        return t
-                except Exception:
-                    continue
-            return ""
+            dom = (urlparse(url).netloc or "").lower()
+            # Any URL in the same domain lends its thesis
+            return _theses_by_domain(cls).get(dom, "")
         except Exception:
             return ""
 
@@ -214,3 +207,15 @@ class GuidelinesConfig:
             f"site:{domain} {topic} methodology",
             f"site:{domain} {topic} advice",
         ]
+
+
+@lru_cache(maxsize=None)
+def _theses_by_domain(config_cls: type) -> Dict[str, str]:
+    """Map domain -> first configured thesis for that domain (parsed once per class)."""
+    mapping: Dict[str, str] = {}
+    for u, t in config_cls.GUIDELINE_THESES.items():
+        try:
+            mapping.setdefault((urlparse(u).netloc or "").lower(), t)
+        except Exception:
+            continue
+    return mapping
@@ -9,11 +9,37 @@ from __future__ import annotations
 
 import re
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
+from ...citations import stable_id
 from .config import GuidelinesConfig
 
+_TOKEN_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+_SCHEME_RE = re.compile(r"https?://")
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _tokenize(text: str) -> FrozenSet[str]:
+    return frozenset(t for t in _TOKEN_SPLIT_RE.split(text.lower()) if t)
+
+
+@lru_cache(maxsize=1)
+def _curated_url_index() -> Dict[str, List[Tuple[str, str, FrozenSet[str]]]]:
+    """Tokenize the static curated URL list once: domain -> [(url, path, path_tokens)]."""
+    index: Dict[str, List[Tuple[str, str, FrozenSet[str]]]] = {}
+    for domain, urls in GuidelinesConfig.urls_by_domain().items():
+        entries = []
+        for u in urls:
+            path = _SCHEME_RE.sub("", u.lower())
+            entries.append((u, path, _tokenize(path)))
+        index[domain] = entries
+    return index
+
 
 class EvidenceCollector:
     """Handles evidence collection from curated and search sources."""
@@ -39,6 +65,7 @@ class EvidenceCollector:
 
         start_time = time.time()
         global_deadline = start_time + float(getattr(self.config, "GLOBAL_RETRIEVAL_BUDGET_SECS", 8.0))
+        now_iso = _utc_now_iso()
 
         for domain in self.config.GUIDELINE_SOURCES.keys():
             if time.time() > global_deadline:
@@ -55,8 +82,6 @@ class EvidenceCollector:
                     break
 
                 try:
-                    now_iso = datetime.utcnow().isoformat() + "Z"
-
                     if supports_structured:
                         results = provider.search_structured(
                             q, domain=domain, mode=mode, max_results=max_per_source
@@ -75,7 +100,7 @@ class EvidenceCollector:
                             )[:800]
                             if not snippet:
                                 snippet = self._select_curated_thesis(domain, url, topic)
-                            evidence_id = f"ev_{hash((domain, q, url, title)) & 0xfffffff:x}"
+                            evidence_id = stable_id("ev", domain, q, url, title)
                             item = {
                                 "evidence_id": evidence_id,
                                 "domain": domain,
@@ -108,7 +133,7 @@ class EvidenceCollector:
                         )
                         snippet = str(raw)[:800]
                         title = f"{domain} — result"
-                        evidence_id = f"ev_{hash((domain, q, url, title)) & 0xfffffff:x}"
+                        evidence_id = stable_id("ev", domain, q, url, title)
                         search_url = f"https://duckduckgo.com/?q={q.replace(' ', '+')}"
                         item = {
                             "evidence_id": evidence_id,
@@ -143,32 +168,22 @@ class EvidenceCollector:
 
         items: List[Dict[str, Any]] = []
         try:
-            topic_text = (topic or "").lower()
-            topic_tokens = {t for t in re.split(r"[^a-z0-9]+", topic_text) if t}
-            by_domain = GuidelinesConfig.urls_by_domain()
+            topic_tokens = _tokenize(topic or "")
+            by_domain = _curated_url_index()
             domain_desc = getattr(self.config, "GUIDELINE_SOURCES", {})
 
             scored: List[tuple[int, Dict[str, Any]]] = []
-            now_iso = datetime.utcnow().isoformat() + "Z"
+            now_iso = _utc_now_iso()
 
-            for domain, urls in by_domain.items():
-                desc_tokens = {
-                    t
-                    for t in re.split(
-                        r"[^a-z0-9]+", str(domain_desc.get(domain, "")).lower()
-                    )
-                    if t
-                }
-                for u in urls:
-                    u_lower = u.lower()
-                    path = re.sub(r"https?://", "", u_lower)
-                    path_tokens = {t for t in re.split(r"[^a-z0-9]+", path) if t}
+            for domain, entries in by_domain.items():
+                desc_tokens = _tokenize(str(domain_desc.get(domain, "")))
+                for u, path, path_tokens in entries:
                     overlap = len(topic_tokens & (path_tokens | desc_tokens))
                     tie_break = len(path)
                     score = overlap * 1000 + tie_break
                     title = self._title_from_url(u)
                     thesis = GuidelinesConfig.thesis_for_url(u)
-                    ev_id = f"cv_{hash((domain, u)) & 0xfffffff:x}"
+                    ev_id = stable_id("cv", domain, u)
                     scored.append(
                         (
                             score,
@@ -197,7 +212,7 @@ class EvidenceCollector:
 
     def _title_from_url(self, url: str) -> str:
         try:
-            cleaned = re.sub(r"https?://", "", url)
+            cleaned = _SCHEME_RE.sub("", url)
             parts = [p for p in cleaned.split("/") if p]
             if not parts:
                 return url
@@ -211,25 +226,20 @@ class EvidenceCollector:
 
     def _select_curated_url(self, domain: str, topic: str, query_used: str) -> Optional[str]:
         try:
-            by_domain = GuidelinesConfig.urls_by_domain()
-            urls = by_domain.get(domain.lower()) or []
-            if not urls:
+            entries = _curated_url_index().get(domain.lower()) or []
+            if not entries:
                 return None
-            text = f"{topic} {query_used}".lower()
-            text_tokens = {t for t in re.split(r"[^a-z0-9]+", text) if t}
+            text_tokens = _tokenize(f"{topic} {query_used}")
             best_url: Optional[str] = None
             best_score = -1
-            for u in urls:
-                u_lower = u.lower()
-                path = re.sub(r"https?://", "", u_lower)
-                path_tokens = {t for t in re.split(r"[^a-z0-9]+", path) if t}
+            for u, _path, path_tokens in entries:
                 score = len(text_tokens & path_tokens)
                 if score > best_score or (
                     score == best_score and best_url is not None and len(u) > len(best_url)
                 ):
                     best_score = score
                     best_url = u
-            return best_url or urls[0]
+            return best_url or entries[0][0]
         except Exception:
             return None
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Any, Dict, List, Optional
 
 from ..cache import CostTracker, GuidelinesCache
@@ -7,6 +8,8 @@ from ..config import GuidelinesConfig
 from ..formatter import GuidelinesFormatter
 from ..query_builder import QueryBuilder
 from ..search_providers import BaseSearchProvider
+from ..utils import content_fingerprint
+from ....citations import stable_id
 
 
 class GuidelinesV1Executor:
@@ -28,23 +31,44 @@ class GuidelinesV1Executor:
         self._cache = cache
         self._cost_tracker = cost_tracker
 
+    def _search(self, query_str: str) -> Optional[str]:
+        if self._search_tool and getattr(self._search_tool, "supports_text", False):
+            return self._search_tool.search_text(query_str)
+        if self._search_tool:
+            return self._search_tool.run(query_str)
+        return None
+
     def run(self, topic: str, cache_key: str) -> Dict[str, Any]:
         search_queries = self._query_builder.get_prioritized_queries(topic)[
             : self._config.MAX_SEARCH_QUERIES
         ]
         retrieved: List[Dict[str, Any]] = []
+        raw_results: List[Optional[str]] = [None] * len(search_queries)
 
-        for query_str in search_queries:
-            try:
-                results = None
-                if self._search_tool and getattr(self._search_tool, "supports_text", False):
-                    results = self._search_tool.search_text(query_str)
-                elif self._search_tool:
-                    results = self._search_tool.run(query_str)
+        # Queries are independent network round-trips: issue them concurrently
+        # and keep whatever finished within the retrieval budget, in query order.
+        if search_queries:
+            pool = ThreadPoolExecutor(max_workers=len(search_queries))
+            futures = {pool.submit(self._search, q): i for i, q in enumerate(search_queries)}
+            done, _ = wait(futures, timeout=float(getattr(self._config, "GLOBAL_RETRIEVAL_BUDGET_SECS", 8.0)))
+            pool.shutdown(wait=False, cancel_futures=True)
+            for fut in done:
+                try:
+                    raw_results[futures[fut]] = fut.result()
+                except Exception:
+                    continue
 
+        # Overlapping site queries often return the same snippet; keep the first
+        seen_content: set[bytes] = set()
+        for query_str, results in zip(search_queries, raw_results):
+            try:
                 if results and len(results) > 20:
+                    fingerprint = content_fingerprint(results)
+                    if fingerprint in seen_content:
+                        continue
+                    seen_content.add(fingerprint)
                     source_type = self._query_builder.identify_source_type(query_str)
-                    guide_id = f"guide_{hash(results) & 0xfffff:05x}"
+                    guide_id = stable_id("guide", results, digest_size=3)
                     source_domain = self._query_builder.extract_domain(query_str)
                     retrieved.append(
                         {
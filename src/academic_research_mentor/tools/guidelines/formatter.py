@@ -7,6 +7,8 @@ and user presentation.
 
 from typing import Any, Dict, List, Optional
 
+from .utils import normalize_url
+
 
 class GuidelinesFormatter:
     """Handles content formatting for research guidelines."""
@@ -41,25 +43,17 @@ class GuidelinesFormatter:
                           sources_covered: List[str], response_format: str, 
                           page_size: int, next_token: Optional[str] = None) -> Dict[str, Any]:
         """Format V2 structured response with pagination."""
-        # Apply response format
-        if response_format == "concise":
-            # Trim snippets
-            concise_evidence = [
-                {
-                    **item,
-                    "snippet": item.get("snippet", "")[:300]
-                } for item in evidence
-            ]
-        else:
-            concise_evidence = evidence
-
-        # Deduplicate by URL
+        # Deduplicate by canonical URL (tracking params, fragments, trailing slash ignored).
+        # Snippets are not compared: curated URLs can share a domain-level thesis.
         seen = set()
         deduped = []
-        for item in concise_evidence:
+        for item in evidence:
             url = item.get("url")
-            if url and url not in seen:
-                seen.add(url)
+            if not url:
+                continue
+            key = normalize_url(url)
+            if key not in seen:
+                seen.add(key)
                 deduped.append(item)
 
         capped_all = deduped[: self.config.RESULT_CAP]
@@ -70,6 +64,9 @@ class GuidelinesFormatter:
             start_index = int(next_token)
         end_index = min(start_index + page_size, len(capped_all))
         page_items = capped_all[start_index:end_index]
+        if response_format == "concise":
+            # Trim snippets only for the items actually returned
+            page_items = [{**item, "snippet": item.get("snippet", "")[:300]} for item in page_items]
         new_next_token = str(end_index) if end_index < len(capped_all) else None
 
         return {
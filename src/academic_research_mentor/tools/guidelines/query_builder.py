@@ -10,6 +10,26 @@ from typing import List
 
 from .config import GuidelinesConfig
 
+_SITE_RE = re.compile(r'site:(\S+)')
+
+# Checked in order; first domain substring found in the query wins
+_SOURCE_TYPE_MAP = (
+    ("gwern.net", "Hamming's research methodology"),
+    ("lesswrong.com", "Research project selection"),
+    ("colah.github.io", "Research taste and judgment"),
+    ("michaelnielsen.org", "Research methodology principles"),
+    ("letters.lossfunk.com", "Research methodology and good science"),
+    ("alignmentforum.org", "Research process and ML guidance"),
+    ("neelnanda.io", "Mechanistic interpretability methodology"),
+    ("joschu.net", "ML research methodology"),
+    ("arxiv.org", "Academic research papers"),
+)
+
+# Substring keywords (e.g. "method" should also match "methodology")
+_PROBLEM_KWS = ('problem', 'choose', 'select', 'pick')
+_TASTE_KWS = ('taste', 'judgment', 'quality', 'good')
+_METHOD_KWS = ('method', 'process', 'approach', 'how')
+
 
 class QueryBuilder:
     """Handles query generation and prioritization for research guidelines."""
@@ -20,10 +40,9 @@ class QueryBuilder:
     def get_prioritized_queries(self, topic: str) -> List[str]:
         """Generate prioritized search queries based on topic keywords."""
         topic_lower = topic.lower()
-        base_queries = self.config.get_search_queries(topic)
         
         # Prioritize queries based on topic content
-        if any(keyword in topic_lower for keyword in ['problem', 'choose', 'select', 'pick']):
+        if any(keyword in topic_lower for keyword in _PROBLEM_KWS):
             # Prioritize problem selection sources
             return [
                 f"site:lesswrong.com {topic} research project",
@@ -32,7 +51,7 @@ class QueryBuilder:
                 f"site:alignmentforum.org {topic} research process",
                 f"site:michaelnielsen.org {topic} research principles"
             ]
-        elif any(keyword in topic_lower for keyword in ['taste', 'judgment', 'quality', 'good']):
+        elif any(keyword in topic_lower for keyword in _TASTE_KWS):
             # Prioritize research taste sources  
             return [
                 f"site:colah.github.io {topic} research taste",
@@ -41,7 +60,7 @@ class QueryBuilder:
                 f"site:letters.lossfunk.com {topic} research methodology",
                 f"site:thoughtforms.life {topic} research advice"
             ]
-        elif any(keyword in topic_lower for keyword in ['method', 'process', 'approach', 'how']):
+        elif any(keyword in topic_lower for keyword in _METHOD_KWS):
             # Prioritize methodology sources
             return [
                 f"site:michaelnielsen.org {topic} research principles",
@@ -52,32 +71,16 @@ class QueryBuilder:
             ]
         else:
             # Default to diverse mix
-            return base_queries[:6]
+            return self.config.get_search_queries(topic)[:6]
     
     def identify_source_type(self, query: str) -> str:
         """Identify the source type based on the search query."""
-        if "gwern.net" in query:
-            return "Hamming's research methodology"
-        elif "lesswrong.com" in query:
-            return "Research project selection"
-        elif "colah.github.io" in query:
-            return "Research taste and judgment"
-        elif "michaelnielsen.org" in query:
-            return "Research methodology principles"
-        elif "letters.lossfunk.com" in query:
-            return "Research methodology and good science"
-        elif "alignmentforum.org" in query:
-            return "Research process and ML guidance"
-        elif "neelnanda.io" in query:
-            return "Mechanistic interpretability methodology"
-        elif "joschu.net" in query:
-            return "ML research methodology"
-        elif "arxiv.org" in query:
-            return "Academic research papers"
-        else:
-            return "Research guidance"
+        for domain, label in _SOURCE_TYPE_MAP:
+            if domain in query:
+                return label
+        return "Research guidance"
     
     def extract_domain(self, query_str: str) -> str:
         """Extract domain from site: query."""
-        match = re.search(r'site:(\S+)', query_str)
+        match = _SITE_RE.search(query_str)
         return match.group(1) if match else "unknown"
@@ -3,7 +3,49 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+from .utils import normalize_cache_text
+
+
+class _TTLCache:
+    """Small thread-safe LRU with per-entry expiry for provider responses."""
+
+    def __init__(self, maxsize: int, ttl_secs: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl_secs
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= self._ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self._maxsize <= 0 or self._ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.time(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+
+# Shared across provider instances so repeated topics within the TTL skip the network
+_RESULTS_CACHE = _TTLCache(
+    maxsize=int(os.getenv("GUIDELINES_SEARCH_CACHE_SIZE", "512")),
+    ttl_secs=float(os.getenv("GUIDELINES_SEARCH_CACHE_TTL_SECS", "3600")),
+)
 
 
 class BaseSearchProvider:
@@ -60,6 +102,11 @@ class TavilySearchProvider(BaseSearchProvider):
         mode: str = "fast",
         max_results: int = 3,
     ) -> List[Dict[str, Any]]:
+        key = ("tavily", "structured", normalize_cache_text(query), domain, mode, max_results)
+        cached = _RESULTS_CACHE.get(key)
+        if cached is not None:
+            return [dict(r) for r in cached]
+
         search_depth = "advanced" if mode == "exhaustive" else "basic"
         include_domains = [domain] if domain else None
         try:
@@ -76,9 +123,17 @@ class TavilySearchProvider(BaseSearchProvider):
         results = response.get("results") if isinstance(response, dict) else None
         if not isinstance(results, list):
             return []
-        return [r for r in results if isinstance(r, dict)]
+        results = [r for r in results if isinstance(r, dict)]
+        if results:
+            _RESULTS_CACHE.set(key, [dict(r) for r in results])
+        return results
 
     def search_text(self, query: str) -> Optional[str]:
+        key = ("tavily", "text", normalize_cache_text(query))
+        cached = _RESULTS_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         try:
             response = self._client.search(
                 query=query,
@@ -102,23 +157,55 @@ class TavilySearchProvider(BaseSearchProvider):
                 snippets.append(str(content))
         if not snippets:
             return None
-        return "\n".join(snippets)[:1000]
+        text = "\n".join(snippets)[:1000]
+        if len(text) > 20:
+            _RESULTS_CACHE.set(key, text)
+        return text
+
+
+_DDGS_CLIENT: Any = None
+_DDGS_LOCK = threading.Lock()
+
+
+def _shared_ddgs_client(factory: Any) -> Any:
+    """Return one DDGS client shared by every provider so its HTTP sessions are reused."""
+    global _DDGS_CLIENT
+    if _DDGS_CLIENT is None:
+        # Guideline searches fan out over short-lived executors; build the client exactly once
+        with _DDGS_LOCK:
+            if _DDGS_CLIENT is None:
+                _DDGS_CLIENT = factory()
+    return _DDGS_CLIENT
 
 
 class DuckDuckGoSearchProvider(BaseSearchProvider):
-    """Adapter around langchain's DuckDuckGo search tool."""
+    """Adapter around the ``ddgs`` DuckDuckGo client."""
 
     supports_structured = False
     supports_text = True
+    MAX_RESULTS = 5
 
     def __init__(self) -> None:
-        from langchain_community.tools import DuckDuckGoSearchRun
+        from ddgs import DDGS
 
-        self._tool = DuckDuckGoSearchRun()
+        self._factory = DDGS
+
+    def _client(self) -> Any:
+        return _shared_ddgs_client(self._factory)
 
     def search_text(self, query: str) -> Optional[str]:
+        key = ("duckduckgo", "text", normalize_cache_text(query))
+        cached = _RESULTS_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         try:
-            result = self._tool.run(query)
+            results = self._client().text(query, max_results=self.MAX_RESULTS)
         except Exception:
             return None
-        return str(result) if result else None
+        bodies = [str(r.get("body") or "") for r in results or [] if isinstance(r, dict)]
+        text = " ".join(b for b in bodies if b) or None
+        # Skip near-empty responses so transient failures are not memoized
+        if text and len(text) > 20:
+            _RESULTS_CACHE.set(key, text)
+        return text
@@ -7,7 +7,10 @@ academic mentoring advice on methodology, problem selection, and research taste.
 
 from __future__ import annotations
 
+import copy
 import os
+import threading
+from concurrent.futures import Future
 from typing import Any, Dict, Optional
 
 from ..base_tool import BaseTool
@@ -24,7 +27,7 @@ from .search_providers import (
     TavilySearchProvider,
 )
 from .tool_metadata import ToolMetadata
-from .utils import enforce_domain_cap, matches_guidelines_query
+from .utils import enforce_domain_cap, matches_guidelines_query, normalize_cache_text
 
 
 class GuidelinesTool(BaseTool):
@@ -43,6 +46,9 @@ class GuidelinesTool(BaseTool):
         self._formatter: Optional[GuidelinesFormatter] = None
         self._metadata_handler: Optional[ToolMetadata] = None
         self._citation_handler: Optional[GuidelinesCitationHandler] = None
+        # Identical requests already being computed: cache_key -> pending result
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
     
     def initialize(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Initialize the guidelines tool with optional configuration."""
@@ -121,8 +127,8 @@ class GuidelinesTool(BaseTool):
                 "note": "Search tool not available"
             }
         
-        # Check cache first
-        cache_key = f"{query}:{topic}:{mode}:{response_format}:{max_per_source}:{page_size}:{next_token or ''}"
+        # Check cache first; trivially different phrasings (case, spacing) share an entry
+        cache_key = f"{normalize_cache_text(query)}:{normalize_cache_text(topic)}:{mode}:{response_format}:{max_per_source}:{page_size}:{next_token or ''}"
         cached_result = self._cache.get(cache_key) if self._cache else None
         
         if cached_result:
@@ -134,7 +140,41 @@ class GuidelinesTool(BaseTool):
         # Record cache miss
         if self._cost_tracker:
             self._cost_tracker.record_cache_miss()
-        
+
+        # Coalesce concurrent identical requests onto a single search
+        with self._inflight_lock:
+            pending = self._inflight.get(cache_key)
+            if pending is None:
+                future: Future = Future()
+                self._inflight[cache_key] = future
+        if pending is not None:
+            return copy.deepcopy(pending.result())
+
+        try:
+            result = self._execute_uncached(
+                topic, mode, max_per_source, response_format, page_size, next_token, cache_key
+            )
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(copy.deepcopy(result))
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+
+    def _execute_uncached(
+        self,
+        topic: str,
+        mode: str,
+        max_per_source: int,
+        response_format: str,
+        page_size: int,
+        next_token: Optional[str],
+        cache_key: str,
+    ) -> Dict[str, Any]:
+        """Run the V2 or V1 pipeline for a request that missed the cache."""
         try:
             if self.config.FF_GUIDELINES_V2:
                 if not (
@@ -152,12 +192,12 @@ class GuidelinesTool(BaseTool):
                 )
                 return enforce_domain_cap(
                     executor.run(
-                    topic,
-                    mode,
-                    max_per_source,
-                    response_format,
-                    page_size,
-                    next_token,
+                        topic,
+                        mode,
+                        max_per_source,
+                        response_format,
+                        page_size,
+                        next_token,
                         cache_key,
                     ),
                     max_per_source,
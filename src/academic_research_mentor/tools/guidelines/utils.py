@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import re
 from typing import Any, Dict
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 
 _GUIDELINES_PATTERNS = (
@@ -16,9 +18,43 @@ _GUIDELINES_PATTERNS = (
 )
 
 
+# Single alternation compiled once instead of re-searching each pattern per call
+_GUIDELINES_RE = re.compile("|".join(f"(?:{p})" for p in _GUIDELINES_PATTERNS), re.IGNORECASE)
+
+
 def matches_guidelines_query(text: str) -> bool:
-    lowered = text.lower()
-    return any(re.search(pattern, lowered, re.IGNORECASE) for pattern in _GUIDELINES_PATTERNS)
+    return _GUIDELINES_RE.search(text) is not None
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_cache_text(text: str) -> str:
+    """Canonicalize free text for cache keys (case- and whitespace-insensitive)."""
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+_TRACKING_PARAMS = {"fbclid", "gclid", "ref_src"}
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a URL for dedup: lowercase host, no fragment or tracking params."""
+    try:
+        parsed = urlparse(url.strip())
+        query = [
+            (k, v)
+            for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+            if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+        ]
+        path = parsed.path.rstrip("/") or "/"
+        return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), path, "", urlencode(query), ""))
+    except Exception:
+        return url
+
+
+def content_fingerprint(text: str) -> bytes:
+    """Short digest of trimmed, lowercased leading content for duplicate detection."""
+    return hashlib.blake2b(text[:500].strip().lower().encode("utf-8", "ignore"), digest_size=8).digest()
 
 
 def enforce_domain_cap(result: Dict[str, Any], max_per_source: int) -> Dict[str, Any]:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import html
 import logging
+import threading
 import xml.etree.ElementTree as ET
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlencode
@@ -17,6 +18,25 @@ DEFAULT_MAX_RETRIES: int = 2
 
 from .query import extract_phrases_and_tokens, build_arxiv_query, relevance_score
 
+_HTTP_CLIENT: Any = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def _shared_http_client() -> Any:
+    """Return a pooled client reused across arXiv requests and retries."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        # arXiv searches run on orchestrator threads; build the client exactly once
+        with _HTTP_CLIENT_LOCK:
+            if _HTTP_CLIENT is None:
+                _HTTP_CLIENT = httpx.Client(  # type: ignore[union-attr]
+                    timeout=DEFAULT_TIMEOUT_SECONDS,
+                    follow_redirects=True,
+                    headers={"User-Agent": "AcademicResearchMentor/1.0"},
+                    limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),  # type: ignore[union-attr]
+                )
+    return _HTTP_CLIENT
+
 
 class _SimpleResponse:
     def __init__(self, text: str, status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> None:
@@ -34,10 +54,9 @@ def _fetch_with_retry(url: str, params: Optional[Dict[str, Any]] = None, timeout
     for attempt in range(DEFAULT_MAX_RETRIES + 1):
         try:
             if httpx is not None:
-                with httpx.Client(timeout=timeout_s, follow_redirects=True, headers={"User-Agent": "AcademicResearchMentor/1.0"}) as client:
-                    response = client.get(url, params=params)
-                    response.raise_for_status()
-                    return response
+                response = _shared_http_client().get(url, params=params, timeout=timeout_s)
+                response.raise_for_status()
+                return response
             else:
                 import urllib.request as _urlrequest
                 full_url = url
@@ -4,7 +4,7 @@ from typing import Any, Dict, Optional, List
 
 from ...base_tool import BaseTool
 from ....mentor_tools import arxiv_search as legacy_arxiv_search
-from ....citations import Citation, CitationFormatter
+from ....citations import Citation, CitationFormatter, stable_id
 
 
 class ArxivSearchTool(BaseTool):
@@ -53,7 +53,7 @@ class ArxivSearchTool(BaseTool):
         for p in papers:
             url = str(p.get("url", "")).strip()
             title = str(p.get("title", "")).strip() or "Untitled"
-            cid = f"arxiv_{abs(hash(url or title)) & 0xfffffff:x}"
+            cid = stable_id("arxiv", url or title)
             citations.append(Citation(
                 id=cid,
                 title=title,
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import re
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 
 from ...citations import Citation, CitationFormatter
@@ -12,6 +13,26 @@ try:  # pragma: no cover - optional dependency guard
 except Exception:  # pragma: no cover - optional dependency guard
     httpx = None  # type: ignore
 HTTPX_AVAILABLE = httpx is not None
+
+_HTTP_CLIENT: Any = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?|```$")
+
+
+def _shared_http_client() -> Any:
+    """Return a pooled client so repeated searches reuse TCP/TLS connections."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        # Searches run on pool threads; build the client exactly once
+        with _HTTP_CLIENT_LOCK:
+            if _HTTP_CLIENT is None:
+                _HTTP_CLIENT = httpx.Client(  # type: ignore[union-attr]
+                    timeout=20,
+                    limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),  # type: ignore[union-attr]
+                )
+    return _HTTP_CLIENT
+
+
 def execute_tavily_search(
     client: Any,
     *,
@@ -116,12 +137,11 @@ def execute_openrouter_search(
         headers["X-Title"] = title
 
     try:
-        with httpx.Client(timeout=20) as client:  # type: ignore[union-attr]
-            resp = client.post(  # type: ignore[union-attr]
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers=headers,
-                json=body,
-            )
+        resp = _shared_http_client().post(
+            "https://openrouter.ai/api/v1/chat/completions",
+            headers=headers,
+            json=body,
+        )
     except Exception as exc:  # pragma: no cover - network errors
         return None, f"OpenRouter request failed: {exc}"
 
@@ -168,11 +188,14 @@ def execute_openrouter_search(
 
 
 def _parse_json_block(content: str) -> Dict[str, Any]:
-    text = content.strip()
-    if text.startswith("```"):
-        text = re.sub(r"^```(?:json)?", "", text).strip()
-        text = re.sub(r"```$", "", text).strip()
-    return json.loads(text)
+    # Fast path: most responses are already bare JSON
+    try:
+        return json.loads(content)
+    except ValueError:
+        text = content.strip()
+        if not text.startswith("```"):
+            raise
+    return json.loads(_CODE_FENCE_RE.sub("", text).strip())
 
 
 def _format_results(
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import time
+
+
+def test_multiple_tool_calls_run_concurrently_in_order():
+    from academic_research_mentor.agent import MentorAgent, ToolRegistry
+    from academic_research_mentor.llm import ToolCall
+
+    registry = ToolRegistry()
+
+    def slow_echo(text: str) -> str:
+        time.sleep(0.2)
+        return text
+
+    registry.register_function(
+        name="echo",
+        description="Echo text back",
+        parameters={"type": "object", "properties": {"text": {"type": "string"}}},
+        function=slow_echo,
+    )
+    agent = MentorAgent(system_prompt="sys", client=object(), tools=registry)  # type: ignore[arg-type]
+    calls = [ToolCall(id=f"c{i}", name="echo", arguments={"text": str(i)}) for i in range(4)]
+
+    start = time.time()
+    messages = agent._execute_tool_calls(calls)
+    elapsed = time.time() - start
+
+    assert [m.content for m in messages] == ["0", "1", "2", "3"]
+    assert [m.tool_call_id for m in messages] == ["c0", "c1", "c2", "c3"]
+    assert elapsed < 0.6
+
+
+def test_tool_definitions_rebuilt_only_on_registration():
+    from academic_research_mentor.agent import ToolRegistry
+
+    registry = ToolRegistry()
+    registry.register_function("a", "first", function=lambda: "a")
+    first = registry.get_definitions()
+    assert registry.get_definitions()[0] is first[0]
+
+    registry.register_function("b", "second", function=lambda: "b")
+    assert [d.name for d in registry.get_definitions()] == ["a", "b"]
+
+
+def test_stream_response_reuses_loop_and_runs_multi_round_tools():
+    import asyncio
+
+    from academic_research_mentor import cli_simple
+    from academic_research_mentor.agent import MentorAgent, ToolRegistry
+    from academic_research_mentor.llm import ToolCall
+    from academic_research_mentor.llm.types import StreamChunk
+
+    class StubClient:
+        """Streams scripted rounds and, like an httpx pool, refuses a second loop."""
+
+        def __init__(self, rounds):
+            self.rounds = list(rounds)
+            self.calls = 0
+            self.loop = None
+
+        async def stream_async(self, messages, tools=None, include_reasoning=False):
+            loop = asyncio.get_running_loop()
+            if self.loop is None:
+                self.loop = loop
+            assert loop is self.loop, "stream ran on a different event loop"
+            self.calls += 1
+            for chunk in self.rounds.pop(0):
+                yield chunk
+
+    def tool_round(call_id: str) -> list:
+        return [StreamChunk(tool_calls=[ToolCall(id=call_id, name="echo", arguments={"text": call_id})])]
+
+    registry = ToolRegistry()
+    registry.register_function("echo", "Echo text back", function=lambda text: text)
+    client = StubClient([
+        tool_round("a"),
+        tool_round("b"),
+        [StreamChunk(content="first "), StreamChunk(content="answer")],
+        [StreamChunk(content="second answer")],
+    ])
+    agent = MentorAgent(system_prompt="sys", client=client, tools=registry)  # type: ignore[arg-type]
+
+    assert cli_simple.stream_response(agent, "one") == "first answer"
+    assert cli_simple.stream_response(agent, "two") == "second answer"
+    # Two tool rounds plus the final answer, then one streamed request for the second turn.
+    assert client.calls == 4
+    assert [m.content for m in agent.get_history()] == ["one", "first answer", "two", "second answer"]
@@ -21,3 +21,20 @@ def test_enforcer_no_citations_no_change():
     original = "No cites here."
     out = enforce_citation_schema(original)
     assert out == original
+
+
+def test_enforcer_metadata_not_reused_across_calls():
+    text = "Claim [P1]."
+    first = enforce_citation_schema(text, source_metadata=[{"id": "P1", "title": "Alpha"}])
+    second = enforce_citation_schema(text, source_metadata=[{"id": "P1", "title": "Beta"}])
+    plain = enforce_citation_schema(text)
+
+    assert "(Alpha)" in first
+    assert "(Beta)" in second
+    assert "(" not in plain.split("\n")[0]
+
+
+def test_enforcer_accepts_unhashable_metadata_values():
+    meta = [{"id": "P1", "title": ["Multi", "part"], "year": 2024, "strength": "weak"}]
+    out = enforce_citation_schema("Claim [P1].", source_metadata=meta)
+    assert "(['Multi', 'part'] | 2024 [weak])" in out
@@ -11,6 +11,37 @@ from academic_research_mentor.citations import Citation, CitationFormatter, Cita
 class TestCitation:
     """Test Citation data model."""
     
+    def test_stable_id_is_deterministic(self):
+        """IDs must not depend on per-process hash randomization."""
+        import os
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        from academic_research_mentor.citations import stable_id
+
+        cid = stable_id("arxiv", "https://arxiv.org/abs/1234.5678")
+        assert cid.startswith("arxiv_") and len(cid) == len("arxiv_") + 8
+        assert cid != stable_id("arxiv", "https://arxiv.org/abs/1234.5679")
+        out = subprocess.run(
+            [sys.executable, "-c",
+             "from academic_research_mentor.citations import stable_id;"
+             "print(stable_id('arxiv', 'https://arxiv.org/abs/1234.5678'))"],
+            capture_output=True, text=True,
+            env={**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1] / "src")},
+        )
+        assert out.stdout.strip() == cid
+
+    def test_merger_assigns_stable_ids(self):
+        """Merging papers and guidelines must not trip over local ID names."""
+        from academic_research_mentor.citations import CitationMerger
+
+        merged = CitationMerger().merge_citations(
+            papers=[{"title": "Paper", "url": "https://arxiv.org/abs/1"}],
+            guidelines=[{"title": "Guide", "url": "https://gwern.net/x"}],
+        )
+        assert "[P1]" in merged["context"] and "[G1]" in merged["context"]
+    
     def test_citation_creation(self):
         """Test basic citation creation."""
         citation = Citation(
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from academic_research_mentor.cli.main import _sniff_fast_path
+
+
+def test_fast_path_for_flag_only_commands() -> None:
+    assert _sniff_fast_path(["--check-env"]) == "verify_environment"
+    assert _sniff_fast_path(["--show-runs", "--list-tools"]) == "list_tools_command"
+
+
+def test_fast_path_defers_to_full_dispatch() -> None:
+    assert _sniff_fast_path([]) is None
+    assert _sniff_fast_path(["--recommend", "x", "--show-runs"]) is None
+    assert _sniff_fast_path(["--show-candidates", "x", "--list-tools"]) is None
+    assert _sniff_fast_path(["--check-env", "--help"]) is None
@@ -78,3 +78,20 @@ def test_exit_turn_not_counted_in_summary(tmp_path) -> None:
         assert summary["logged_entries"] == 2
     finally:
         manager.finalize("test_clean")
+
+
+def test_unsaved_session_log_is_resumable(tmp_path) -> None:
+    manager = SessionLogManager(log_dir=str(tmp_path))
+    try:
+        chat_logger = ChatLogger(log_dir=str(tmp_path), session_logger=manager)
+        _write_sample_turn(chat_logger)
+
+        # Turns are streamed to disk before save_session closes the array
+        turns, resolved = _load_turns_from_path(str(chat_logger.session_dir))
+        assert resolved is not None
+        assert [t["ai_response"] for t in turns] == ["Hi there!"]
+
+        saved_path = Path(chat_logger.save_session())
+        assert json.loads(saved_path.read_text(encoding="utf-8"))[0]["stage"] == {"stage": "A"}
+    finally:
+        manager.finalize("test_clean")
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from academic_research_mentor.tools.guidelines.cache import GuidelinesCache
+from academic_research_mentor.tools.guidelines.config import GuidelinesConfig
+
+
+def _make_cache(monkeypatch, tmp_path) -> GuidelinesCache:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return GuidelinesCache(GuidelinesConfig())
+
+
+def test_memory_tier_serves_hits_without_disk(monkeypatch, tmp_path):
+    cache = _make_cache(monkeypatch, tmp_path)
+    cache.set("q", {"evidence": [{"url": "u"}]})
+    for path in cache.cache_dir.glob("*.json"):
+        path.unlink()
+
+    hit = cache.get("q")
+    assert hit == {"evidence": [{"url": "u"}]}
+    hit["cached"] = True
+    assert "cached" not in cache.get("q"), "callers must receive private copies"
+
+
+def test_memory_tier_respects_ttl_and_clear(monkeypatch, tmp_path):
+    cache = _make_cache(monkeypatch, tmp_path)
+    cache.set("q", {"value": 1})
+    key = cache._get_cache_key("q")
+    _, result = cache._memory[key]
+    cache._memory[key] = (0.0, result)
+    for path in cache.cache_dir.glob("*.json"):
+        path.unlink()
+    assert cache.get("q") is None
+
+    cache.set("q", {"value": 2})
+    cache.clear()
+    assert cache.get("q") is None
+
+
+def test_cost_tracker_throttles_writes_and_flushes(monkeypatch, tmp_path):
+    import json
+
+    cache = _make_cache(monkeypatch, tmp_path)
+    tracker = cache.cost_tracker
+    tracker.record_cache_miss()
+    tracker.record_cache_miss()
+    on_disk = json.loads(tracker.stats_file.read_text())
+    assert on_disk["cache_misses"] == 1, "second update should be deferred"
+
+    tracker.flush()
+    on_disk = json.loads(tracker.stats_file.read_text())
+    assert on_disk["cache_misses"] == 2
+
+
+def test_provider_results_cached_by_normalized_query():
+    from academic_research_mentor.tools.guidelines import search_providers as sp
+
+    class _FakeTavily:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def search(self, **kwargs):
+            self.calls += 1
+            return {"results": [{"url": "https://x", "content": "a long enough snippet of text"}]}
+
+    provider = sp.TavilySearchProvider.__new__(sp.TavilySearchProvider)
+    provider._client = _FakeTavily()
+    first = provider.search_structured("Cache Probe Query", domain="x", max_results=1)
+    first[0]["content"] = "mutated"
+    second = provider.search_structured("cache  probe query", domain="x", max_results=1)
+    assert provider._client.calls == 1
+    assert second[0]["content"] == "a long enough snippet of text"
+
+    assert provider.search_text("Cache Probe Text") == provider.search_text("cache probe text")
+    assert provider._client.calls == 2
+
+
+def test_duckduckgo_provider_joins_ddgs_bodies(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from academic_research_mentor.tools.guidelines import search_providers as sp
+
+    monkeypatch.setattr(sp, "_DDGS_CLIENT", None)
+    created = []
+
+    class _FakeDDGS:
+        def __init__(self) -> None:
+            created.append(self)
+
+        def text(self, query, max_results=5):
+            return [{"body": "first research snippet"}, {"body": ""}, {"body": "second snippet"}]
+
+    def _provider():
+        provider = sp.DuckDuckGoSearchProvider.__new__(sp.DuckDuckGoSearchProvider)
+        provider._factory = _FakeDDGS
+        return provider
+
+    assert _provider().search_text("ddgs join probe") == "first research snippet second snippet"
+    # Separate providers on separate executor threads share the one client
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda i: _provider().search_text(f"ddgs join probe {i}"), range(8)))
+    assert len(created) == 1
+
+
+def test_failed_cache_write_keeps_previous_entry(monkeypatch, tmp_path):
+    cache = _make_cache(monkeypatch, tmp_path)
+    cache.set("q", {"value": 1})
+    cache._memory.clear()
+
+    cache.set("q", {"value": object()})  # not JSON-serializable
+    cache._memory.clear()
+
+    assert cache.get("q") == {"value": 1}
+    assert not list(cache.cache_dir.glob("*.tmp")), "temp files must be cleaned up"
+
+
+def test_concurrent_gets_on_expired_memory_entry(monkeypatch, tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = _make_cache(monkeypatch, tmp_path)
+    cache.set("q", {"value": 1})
+    key = cache._get_cache_key("q")
+    for path in cache.cache_dir.glob("*.json"):
+        path.unlink()
+
+    def _expire_and_get(_):
+        _, result = cache._memory.get(key, (0.0, {"value": 1}))
+        with cache._memory_lock:
+            cache._memory[key] = (0.0, result)
+        return cache.get("q")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(_expire_and_get, range(64))) == [None] * 64
+
+
+def test_cost_tracker_not_kept_alive_by_exit_hook(monkeypatch, tmp_path):
+    import gc
+    import json
+    import weakref
+
+    cache = _make_cache(monkeypatch, tmp_path)
+    tracker = cache.cost_tracker
+    stats_file = tracker.stats_file
+    tracker.record_cache_miss()
+    tracker.record_cache_miss()
+    ref = weakref.ref(tracker)
+    del cache, tracker
+    gc.collect()
+
+    assert ref() is None
+    assert json.loads(stats_file.read_text())["cache_misses"] == 2
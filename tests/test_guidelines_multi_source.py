@@ -40,3 +40,14 @@ def test_multi_source_coverage_and_caps(monkeypatch):
     assert all(c <= 1 for c in counts.values())
 
 
+
+
+def test_normalize_url_drops_only_tracking_params():
+    from academic_research_mentor.tools.guidelines.utils import normalize_url
+
+    tracked = "https://Example.com/post/?utm_source=x&fbclid=1&gclid=2&ref_src=tw&id=7#top"
+    assert normalize_url(tracked) == "https://example.com/post?id=7"
+
+    # "source" and "ref" select content on some sites, so they must keep URLs distinct.
+    assert normalize_url("https://example.com/doc?source=a") != normalize_url("https://example.com/doc?source=b")
+    assert normalize_url("https://example.com/doc?ref=v1") != normalize_url("https://example.com/doc?ref=v2")
@@ -135,3 +135,84 @@ def test_cache_key_includes_pagination_and_params(monkeypatch):
     assert key2 is not None
     assert key1 != key2, "Changing page_size should change cache key"
 
+
+
+def test_cache_key_ignores_case_and_whitespace(monkeypatch):
+    tool = _make_tool(monkeypatch)
+    tool.execute({"query": "Mentorship", "topic": "Problem   Selection"})
+    key1 = tool._cache.last_get_key
+    tool.execute({"query": " mentorship ", "topic": "problem selection"})
+    key2 = tool._cache.last_get_key
+    assert key1 == key2
+
+
+def test_concurrent_identical_requests_are_coalesced(monkeypatch):
+    import threading
+    import time
+
+    tool = _make_tool(monkeypatch)
+    calls: list[str] = []
+
+    def _slow_execute(*args, **kwargs):
+        calls.append(args[-1])
+        time.sleep(0.2)
+        return {"evidence": [], "total_evidence": 0}
+
+    tool._execute_uncached = _slow_execute  # type: ignore[assignment]
+    results: list[Dict[str, Any]] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(tool.execute({"query": "mentorship"})))
+        for _ in range(3)
+    ]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+
+    assert len(calls) == 1
+    assert len(results) == 3
+    assert all(r == {"evidence": [], "total_evidence": 0} for r in results)
+
+
+def test_v1_queries_run_concurrently_in_order(monkeypatch):
+    import time
+
+    tool = _make_tool(monkeypatch)
+    tool.config.FF_GUIDELINES_V2 = False
+
+    class _SlowSearch(_StubSearch):
+        def search_text(self, query: str) -> str:
+            time.sleep(0.3)
+            return super().search_text(query)
+
+    tool._search_tool = _SlowSearch("slow-result")
+    start = time.time()
+    out = tool.execute({"query": "research taste"})
+    elapsed = time.time() - start
+
+    queries = [g["search_query"] for g in out["retrieved_guidelines"]]
+    assert len(queries) == tool.config.MAX_SEARCH_QUERIES
+    assert queries == tool._query_builder.get_prioritized_queries("research taste")[: len(queries)]
+    assert elapsed < 0.3 * len(queries)
+
+
+def test_duplicate_results_collapsed(monkeypatch):
+    from academic_research_mentor.tools.guidelines.formatter import GuidelinesFormatter
+
+    tool = _make_tool(monkeypatch)
+    tool.config.FF_GUIDELINES_V2 = False
+
+    class _SameSearch(_StubSearch):
+        def search_text(self, query: str) -> str:
+            return "Identical snippet returned for every site query"
+
+    tool._search_tool = _SameSearch("")
+    out = tool.execute({"query": "research taste"})
+    assert out["total_guidelines"] == 1
+
+    evidence = [
+        {"url": "https://example.com/post/?utm_source=feed", "domain": "example.com", "snippet": "a"},
+        {"url": "https://EXAMPLE.com/post#intro", "domain": "example.com", "snippet": "b"},
+    ]
+    page = GuidelinesFormatter(tool.config).format_v2_response("t", evidence, [], "concise", 10)
+    assert page["total_evidence"] == 1
@@ -135,6 +135,11 @@ def test_web_search_fallbacks_to_openrouter(monkeypatch) -> None:  # type: ignor
         _DummyClient,
         raising=False,
     )
+    # Drop any pooled client from earlier tests so the dummy transport is used
+    monkeypatch.setattr(
+        "academic_research_mentor.tools.web_search.providers._HTTP_CLIENT",
+        None,
+    )
 
     tool = WebSearchTool()
     tool.initialize()
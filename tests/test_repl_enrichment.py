@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+
+class _Logger:
+    def __init__(self) -> None:
+        self.events: list[str] = []
+
+    def log_event(self, name, payload) -> None:
+        self.events.append(name)
+
+
+def _enrich(monkeypatch, results):
+    from academic_research_mentor.cli import repl_helpers
+
+    deps = SimpleNamespace(
+        has_attachments=lambda: True,
+        search=lambda query, k=6: results,
+        guidelines_tool=lambda query: "",
+        experiment_planner=lambda query: "",
+    )
+    monkeypatch.setattr(repl_helpers, "_enrichment_deps", lambda: deps)
+    return repl_helpers.build_react_enhanced_input("what is this?", _Logger())  # type: ignore[arg-type]
+
+
+def test_snippet_keeps_content_after_leading_whitespace(monkeypatch):
+    body = "x" * 300
+    enhanced = _enrich(monkeypatch, [{"file": "a.pdf", "page": 2, "text": " " * 40 + "\n" + body}])
+
+    assert f"- [a.pdf:2] {'x' * 220}…" in enhanced.splitlines()
+
+
+def test_snippet_short_text_has_no_ellipsis(monkeypatch):
+    enhanced = _enrich(monkeypatch, [{"file": "b.pdf", "page": 1, "text": "short\ntext   \n\n"}])
+
+    assert "- [b.pdf:1] short text" in enhanced.splitlines()
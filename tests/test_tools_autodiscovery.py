@@ -12,3 +12,13 @@ def test_auto_discover_registers_web_search_tool() -> None:
     # Check minimal metadata presence
     meta = t.get_metadata()
     assert meta.get("identity", {}).get("name") == "web_search"
+
+
+def test_auto_discover_retries_package_after_failed_walk() -> None:
+    import pytest
+    from academic_research_mentor import tools as tools_pkg
+
+    missing = "academic_research_mentor.tools._no_such_package"
+    with pytest.raises(ImportError):
+        auto_discover(missing)
+    assert missing not in tools_pkg._discovered_packages